@@ -0,0 +1,89 @@
+import time
+from settings import AI_BUDGET_US, AI_COST_US, AI_FAR_INTERVAL
+
+
+class AIScheduler:
+    """Decides which enemies steer and attack this tick.
+
+    Enemies on screen are due every tick; those off screen only every
+    ``far_interval`` ticks, in round-robin buckets by entity id. The due
+    enemies are then capped by a per-tick budget of ``budget_us``
+    microseconds at ``cost_us`` per agent: the nearest go first and the
+    rest are deferred to the front of the next tick's queue.
+
+    By default the cost per agent is the fixed estimate, so decisions
+    depend only on the game state and replays stay exact. With
+    ``adaptive`` the estimate follows measured times and any overrun is
+    carried over as debt against the next tick's budget.
+    """
+
+    def __init__(self, budget_us=AI_BUDGET_US, cost_us=AI_COST_US, far_interval=AI_FAR_INTERVAL,
+                 adaptive=False, min_agents=8):
+        self.budget_us = budget_us
+        self.cost_us = cost_us
+        self.far_interval = far_interval
+        self.adaptive = adaptive
+        self.min_agents = min_agents
+        self.reset()
+
+    def reset(self):
+        self.tick = 0
+        self.carried = []
+        self.debt_us = 0.0
+        self.scheduled = 0
+        self.deferred = 0
+        self.skipped = 0
+        self.total_deferred = 0
+        self._started = 0.0
+
+    def begin(self, enemies, view, player):
+        """Return the subset of living ``enemies`` that think this tick."""
+        tick = self.tick
+        self.tick += 1
+        carried = [enemy for enemy in self.carried if enemy.alive and enemy.hp > 0]
+        waiting = {id(enemy) for enemy in carried}
+
+        due = []
+        skipped = 0
+        for enemy in enemies:
+            if id(enemy) in waiting:
+                continue
+            if view.colliderect(enemy.rect) or (enemy.id + tick) % self.far_interval == 0:
+                due.append(enemy)
+            else:
+                skipped += 1
+
+        limit = len(carried) + len(due)
+        if self.budget_us:
+            limit = max(self.min_agents, int((self.budget_us - self.debt_us) / self.cost_us))
+        if len(carried) + len(due) > limit:
+            px, py = player.rect.center
+            due.sort(key=lambda enemy: (enemy.rect.centerx - px) ** 2 + (enemy.rect.centery - py) ** 2)
+        queue = carried + due
+        thinking, self.carried = queue[:limit], queue[limit:]
+
+        self.scheduled = len(thinking)
+        self.deferred = len(self.carried)
+        self.skipped = skipped
+        self.total_deferred += self.deferred
+        if self.adaptive:
+            self._started = time.perf_counter()
+        return thinking
+
+    def end(self):
+        """Close the tick; in adaptive mode, learn the per-agent cost and carry any overrun."""
+        if not self.adaptive or not self.budget_us:
+            return
+        spent = (time.perf_counter() - self._started) * 1e6
+        if self.scheduled >= self.min_agents:
+            self.cost_us = 0.9 * self.cost_us + 0.1 * spent / self.scheduled
+        self.debt_us = min(max(self.debt_us + spent - self.budget_us, 0.0), self.budget_us)
+
+    def stats(self):
+        return {
+            "scheduled": self.scheduled,
+            "deferred": self.deferred,
+            "skipped": self.skipped,
+            "total_deferred": self.total_deferred,
+            "cost_us": self.cost_us,
+        }
@@ -0,0 +1,37 @@
+from texture_cache import texture_cache
+
+
+class AnimationRegistry:
+    """Decodes each animation strip once per target size and shares the frames."""
+
+    def __init__(self):
+        self._strips = {}
+        self._frames = {}
+
+    def register(self, name, paths):
+        self._strips[name] = list(paths)
+
+    def paths(self, name):
+        return list(self._strips[name])
+
+    def frames(self, name, size):
+        key = (name, tuple(size))
+        frames = self._frames.get(key)
+        if frames is None:
+            frames = tuple(texture_cache.get(path, key[1]) for path in self._strips[name])
+            self._frames[key] = frames
+        return frames
+
+    def frame(self, name, size, index):
+        return self.frames(name, size)[index]
+
+    def frame_count(self, name):
+        return len(self._strips[name])
+
+    def preload(self, entries):
+        for name, size in entries:
+            self.frames(name, size)
+
+
+animation_registry = AnimationRegistry()
+animation_registry.register("explosion", [f"animations/explosion/{i}.png" for i in range(7)])
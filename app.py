@@ -0,0 +1,61 @@
+import time
+import logging
+import pygame
+from settings import win_width, win_height, background_image, main_background_image
+from texture_cache import texture_cache
+
+
+class AppContext:
+    """Creates pygame, the window and shared assets on first use.
+
+    Importing game modules has no side effects; the first access to
+    ``display`` initialises pygame and opens the one and only window.
+    Every lazily created resource is timed for the startup report.
+    """
+
+    def __init__(self):
+        self._display = None
+        self._clock = None
+        self.timings = {}
+
+    def timed(self, name, build):
+        start = time.perf_counter()
+        value = build()
+        self.timings[name] = time.perf_counter() - start
+        return value
+
+    @property
+    def display(self):
+        if self._display is None:
+            self.timed("pygame_init", pygame.init)
+            self._display = self.timed("display", lambda: pygame.display.set_mode((win_width, win_height)))
+        return self._display
+
+    @property
+    def clock(self):
+        if self._clock is None:
+            self._clock = pygame.time.Clock()
+        return self._clock
+
+    @property
+    def background(self):
+        return self._texture("background", background_image)
+
+    @property
+    def main_background(self):
+        return self._texture("main_background", main_background_image)
+
+    def _texture(self, name, path):
+        self.display  # convert_alpha needs the window to exist
+        if name not in self.timings:
+            return self.timed(name, lambda: texture_cache.get(path, (win_width, win_height)))
+        return texture_cache.get(path, (win_width, win_height))
+
+    def report(self):
+        total = sum(self.timings.values())
+        logging.info("Запуск: %.3f с (%s)", total,
+                     ", ".join(f"{name} {seconds * 1000:.1f} мс" for name, seconds in self.timings.items()))
+        return dict(self.timings, total=total)
+
+
+app = AppContext()
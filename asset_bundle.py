@@ -0,0 +1,181 @@
+import argparse
+import glob
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+import pygame
+from settings import (asset_bundle_path, player_image, block_image, enemybullet_image, playerbullet_image,
+                      zombie_image, shooter_image, background_image, main_background_image, win_width, win_height)
+
+MAGIC = b"SGAB"
+VERSION = 1
+HEADER = struct.Struct("<4sHI")  # magic, version, index length
+ALIGN = 64
+
+
+def default_manifest():
+    """Every ``(path, size)`` the game scales a texture to, plus the sound directory."""
+    from level import Level
+
+    textures = {
+        (player_image, (50, 50)),
+        (zombie_image, (50, 50)),
+        (shooter_image, (50, 50)),
+        (enemybullet_image, (10, 10)),
+        (playerbullet_image, (10, 10)),
+        (background_image, (win_width, win_height)),
+        (main_background_image, (win_width, win_height)),
+    }
+    textures |= {(f"animations/explosion/{i}.png", (50, 50)) for i in range(7)}
+    for path in sorted(glob.glob("levels/*.json")):
+        level = Level.load(path)
+        textures.add((level.background, level.background_size))
+        textures |= {(block_image, rect.size) for rect in level.block_rects()}
+    return sorted(textures), "sounds"
+
+
+def _source_stamp(path):
+    stat = os.stat(path)
+    return [stat.st_size, int(stat.st_mtime)]
+
+
+def build(out=asset_bundle_path, manifest=None):
+    """Decode and scale every texture, decode every sound to PCM and pack them into ``out``."""
+    textures, sound_directory = manifest or default_manifest()
+    entries = []
+    blobs = []
+    for path, size in textures:
+        surface = pygame.transform.scale(pygame.image.load(path), size)
+        blobs.append(pygame.image.tobytes(surface, "RGBA"))
+        entries.append({"kind": "image", "key": f"{path}|{size[0]}x{size[1]}", "size": list(size),
+                        "source": path, "stamp": _source_stamp(path)})
+
+    if not pygame.mixer.get_init():
+        pygame.mixer.init()
+    for file_name in sorted(os.listdir(sound_directory)):
+        name, ext = os.path.splitext(file_name)
+        if ext.lower() not in (".ogg", ".wav"):
+            continue
+        path = os.path.join(sound_directory, file_name)
+        blobs.append(pygame.mixer.Sound(path).get_raw())
+        entries.append({"kind": "sound", "key": name, "source": path, "stamp": _source_stamp(path)})
+
+    # Offsets are relative to the start of the data area, which follows the index.
+    offset = 0
+    for entry, blob in zip(entries, blobs):
+        offset = -(-offset // ALIGN) * ALIGN
+        entry["offset"] = offset
+        entry["length"] = len(blob)
+        offset += len(blob)
+    index = json.dumps({"mixer": list(pygame.mixer.get_init()), "entries": entries}).encode("utf-8")
+    data_start = -(-(HEADER.size + len(index)) // ALIGN) * ALIGN
+
+    with open(out, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(index)))
+        f.write(index)
+        for entry, blob in zip(entries, blobs):
+            f.seek(data_start + entry["offset"])
+            f.write(blob)
+    return len(entries), data_start + offset
+
+
+class AssetBundle:
+    """A packed asset file, mapped into memory copy-on-write.
+
+    Surfaces and sounds are built straight from slices of the mapping, so
+    loading an asset costs no decoding. Writing to such a surface (only
+    possible without a window, where nothing converts it) gets private
+    pages instead of faulting on the file's read-only ones. Entries whose source file changed
+    since the bundle was built are ignored and the caller falls back to
+    the loose file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_COPY)
+        self._view = memoryview(self._map)
+        magic, version, index_length = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: не пакет ресурсів")
+        index = json.loads(bytes(self._view[HEADER.size:HEADER.size + index_length]))
+        self.data_start = -(-(HEADER.size + index_length) // ALIGN) * ALIGN
+        self.mixer = tuple(index["mixer"])
+        self.entries = {}
+        self.stale = 0
+        for entry in index["entries"]:
+            if os.path.exists(entry["source"]) and _source_stamp(entry["source"]) != entry["stamp"]:
+                self.stale += 1
+                continue
+            self.entries[entry["kind"], entry["key"]] = entry
+
+    def _slice(self, entry):
+        start = self.data_start + entry["offset"]
+        return self._view[start:start + entry["length"]]
+
+    def image(self, path, size):
+        """An RGBA surface over the bundled pixels for ``path`` at ``size``, or None."""
+        entry = self.entries.get(("image", f"{path}|{size[0]}x{size[1]}"))
+        if entry is None:
+            return None
+        return pygame.image.frombuffer(self._slice(entry), tuple(entry["size"]), "RGBA")
+
+    def sound(self, name):
+        """A ``mixer.Sound`` over the bundled PCM, or None if missing or the mixer format differs."""
+        entry = self.entries.get(("sound", name))
+        if entry is None or pygame.mixer.get_init() != self.mixer:
+            return None
+        return pygame.mixer.Sound(buffer=self._slice(entry))
+
+
+class BundleLoader:
+    """Opens the bundle on first use; without one every lookup misses."""
+
+    def __init__(self, path=asset_bundle_path):
+        self.path = path
+        self._bundle = None
+        self._opened = False
+        self.open_time = 0.0
+
+    @property
+    def bundle(self):
+        if not self._opened:
+            self._opened = True
+            if self.path and os.path.exists(self.path):
+                start = time.perf_counter()
+                try:
+                    self._bundle = AssetBundle(self.path)
+                except (OSError, ValueError) as error:
+                    logging.warning("Пакет ресурсів не відкрито: %s", error)
+                self.open_time = time.perf_counter() - start
+        return self._bundle
+
+    def image(self, path, size):
+        bundle = self.bundle
+        return bundle.image(path, size) if bundle is not None else None
+
+    def sound(self, name):
+        bundle = self.bundle
+        return bundle.sound(name) if bundle is not None else None
+
+
+asset_bundle = BundleLoader()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack pre-scaled textures and decoded sounds into one file.")
+    parser.add_argument("--out", default=asset_bundle_path)
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.mixer.init()
+    start = time.perf_counter()
+    count, size = build(args.out)
+    print(f"{count} assets, {size / 1e6:.1f} MB -> {args.out} in {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
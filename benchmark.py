@@ -0,0 +1,159 @@
+import headless  # selects the dummy SDL drivers before the window is opened
+
+import argparse
+import json
+import platform
+import random
+import time
+import numpy as np
+import pygame
+from game_sprites import Block
+from settings import block_image, win_width, win_height
+from headless import HeadlessGame
+from chunks import ChunkMap
+
+SCENARIOS = {
+    "default": dict(zombies=3, shooters=5, bullets=0, blocks=4),
+    "crowd": dict(zombies=100, shooters=100, bullets=1000, blocks=20),
+    "horde": dict(zombies=500, shooters=500, bullets=10000, blocks=40),
+}
+
+
+def percentiles(samples):
+    samples = np.asarray(samples, dtype=np.float64) * 1000
+    if not len(samples):
+        return {}
+    p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+    return {
+        "n": len(samples),
+        "mean_ms": float(samples.mean()),
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "max_ms": float(samples.max()),
+    }
+
+
+class Scenario:
+    """A GameManager populated with a fixed number of each kind of entity."""
+
+    def __init__(self, name, zombies, shooters, bullets, blocks, seed=0):
+        self.name = name
+        self.params = dict(zombies=zombies, shooters=shooters, bullets=bullets, blocks=blocks)
+        self.rng = random.Random(seed)
+        self.headless = HeadlessGame(render=False)
+        self.game = self.headless.game
+        self.game.player.hp = float("inf")
+        self.game.bullets.limits = {}
+        self.create_times = []
+
+        placed = [Block(block_image, x, y, 100, 50) for x, y in self.block_layout(blocks)]
+        self.game.place_blocks(placed)
+        # Bake the scenario's blocks into the static layer so drawing matches the geometry.
+        self.game.chunks = ChunkMap(self.game.level, self.game.blocks)
+        self.game.view_origin = None
+
+        self.game.enemies.empty()
+        self.top_up()
+
+    def block_layout(self, count):
+        """Centres of ``count`` tile-aligned 4x2-tile blocks with a one-tile gap between rows.
+
+        Every other column is filled first so small scenarios keep open lanes;
+        slots overlapping the player are skipped.
+        """
+        level = self.game.level
+        size = level.tile_size
+        player = self.game.player.rect
+        slots = []
+        for parity in (0, 1):
+            for row in range((level.rows - 1) // 3):
+                for col in range(parity, level.cols // 4, 2):
+                    rect = pygame.Rect(col * 4 * size, (row * 3 + 1) * size, 4 * size, 2 * size)
+                    if not rect.colliderect(player):
+                        slots.append(rect.center)
+        if count > len(slots):
+            raise ValueError(f"На рівні {level.name or '?'} вміщується лише {len(slots)} блоків")
+        return slots[:count]
+
+    def random_point(self):
+        return self.rng.randint(0, win_width), self.rng.randint(0, win_height)
+
+    def top_up(self):
+        counts = {"zombie": 0, "shooter": 0}
+        for enemy in self.game.enemies:
+            counts[enemy.kind] += 1
+        for enemy_type, wanted in (("zombie", self.params["zombies"]), ("shooter", self.params["shooters"])):
+            for _ in range(wanted - counts[enemy_type]):
+                x, y = self.random_point()
+                start = time.perf_counter()
+                self.game.enemies.spawn(enemy_type, x, y)
+                self.create_times.append(time.perf_counter() - start)
+
+        bullets = self.game.bullets
+        for _ in range(self.params["bullets"] - len(bullets)):
+            x, y = self.random_point()
+            target_x, target_y = self.random_point()
+            bullets.spawn(x, y, target_x, target_y, self.rng.randint(0, 1))
+
+    def run(self, ticks):
+        game = self.game
+        timings = {"tick": [], "simulate": [], "collision": [], "draw": []}
+        deferred = []
+        for _ in range(ticks):
+            self.top_up()
+            game.game_running = True
+
+            start = time.perf_counter()
+            game.simulate()
+            simulated = time.perf_counter()
+            game.draw()
+            drawn = time.perf_counter()
+            timings["simulate"].append(simulated - start)
+            timings["draw"].append(drawn - simulated)
+            timings["tick"].append(drawn - start)
+            deferred.append(game.scheduler.deferred)
+
+            self.top_up()
+            start = time.perf_counter()
+            game.enemy_grid.rebuild(game.enemies)
+            game.collision_handler.check_collision(game.player, game.block_grid)
+            game.bullets.hits(game.player, game.occupancy, game.enemy_grid)
+            timings["collision"].append(time.perf_counter() - start)
+
+        results = {name: percentiles(samples) for name, samples in timings.items()}
+        results["create_enemy"] = percentiles(self.create_times)
+        return {"scenario": self.name, "params": self.params, "ticks": ticks, "timings": results,
+                "ai_deferred_mean": float(np.mean(deferred)) if deferred else 0.0}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time simulation, collision and drawing for entity-count scenarios.")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable, default: all)")
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="benchmark.json")
+    args = parser.parse_args()
+
+    results = []
+    for name in args.scenario or list(SCENARIOS):
+        scenario = Scenario(name, seed=args.seed, **SCENARIOS[name])
+        result = scenario.run(args.ticks)
+        tick = result["timings"]["tick"]
+        print(f"{name:10s} p50 {tick['p50_ms']:8.3f} ms  p95 {tick['p95_ms']:8.3f} ms  p99 {tick['p99_ms']:8.3f} ms")
+        results.append(result)
+
+    report = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
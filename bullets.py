@@ -0,0 +1,255 @@
+import math
+import numpy as np
+import pygame
+from settings import enemybullet_image, playerbullet_image, win_width, win_height
+from texture_cache import texture_cache
+from sound_bank import sound_bank
+from event_log import event_log, Event
+from spatial_grid import DENSE_PAIRS
+
+PLAYER = 0
+ENEMY = 1
+
+
+def rects_to_array(rects):
+    """Pack rects into an (n, 4) array of left, top, right, bottom."""
+    return np.array([(r.left, r.top, r.right, r.bottom) for r in rects], dtype=np.float32).reshape(-1, 4)
+
+
+def overlaps(x, y, half, bounds):
+    """Which bullet centres overlap the single rect in ``bounds``."""
+    left, top, right, bottom = bounds
+    return (x + half > left) & (x - half < right) & (y + half > top) & (y - half < bottom)
+
+
+def first_overlap(x, y, half, grid):
+    """For each bullet centre return the index of the first overlapping grid item, or -1.
+
+    ``grid`` must be built with a margin of at least ``half``.
+    """
+    result = np.full(len(x), -1, dtype=np.intp)
+    if not len(x) or not len(grid.items):
+        return result
+    if len(x) * len(grid.items) <= DENSE_PAIRS:
+        bounds = rects_to_array(entry.rect for entry in grid.items)
+        hit = (
+            (x[:, None] + half > bounds[None, :, 0])
+            & (x[:, None] - half < bounds[None, :, 2])
+            & (y[:, None] + half > bounds[None, :, 1])
+            & (y[:, None] - half < bounds[None, :, 3])
+        )
+        any_hit = hit.any(axis=1)
+        result[any_hit] = hit[any_hit].argmax(axis=1)
+        return result
+
+    point, item = grid.query_points(x, y)
+    if not len(point):
+        return result
+    bounds = rects_to_array(entry.rect for entry in grid.items)[item]
+    hit = (
+        (x[point] + half > bounds[:, 0])
+        & (x[point] - half < bounds[:, 2])
+        & (y[point] + half > bounds[:, 1])
+        & (y[point] - half < bounds[:, 3])
+    )
+    point, item = point[hit], item[hit]
+    hit_points, first = np.unique(point, return_index=True)
+    result[hit_points] = item[first]
+    return result
+
+
+class BulletSystem:
+    """Array-backed pool of every live projectile.
+
+    Positions, velocities, owners and alive flags live in fixed-capacity
+    NumPy arrays; slots are recycled through a free-list stack so firing a
+    shot allocates nothing. Movement and hit tests run as batched passes.
+
+    A bullet also dies when it leaves ``bounds`` (grown by ``margin``) or
+    after ``ttl`` ticks, and ``limits`` caps how many each owner may have
+    alive at once, so misses can never accumulate.
+    """
+
+    def __init__(self, capacity=16384, speed=10, size=10, damage=5,
+                 bounds=(0, 0, win_width, win_height), margin=20, ttl=100, limits=None):
+        self.capacity = capacity
+        self.speed = speed
+        self.size = size
+        self.damage = damage
+        self.margin = margin
+        self.ttl = ttl
+        self.limits = limits if limits is not None else {PLAYER: 256, ENEMY: 2048}
+        self.set_bounds(bounds)
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.prev = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.owner = np.zeros(capacity, dtype=np.int8)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.age = np.zeros(capacity, dtype=np.int32)
+        self._free = np.arange(capacity - 1, -1, -1, dtype=np.int32)
+        self._free_top = capacity
+        self.live = [0, 0]
+        self.dropped = 0
+        self.capped = 0
+        self.culled = 0
+        self.expired = 0
+
+        self.textures = {
+            PLAYER: texture_cache.get(playerbullet_image, (size, size)),
+            ENEMY: texture_cache.get(enemybullet_image, (size, size)),
+        }
+
+    def __len__(self):
+        return self.capacity - self._free_top
+
+    def set_bounds(self, bounds):
+        """World rect ``(x, y, w, h)`` outside which bullets are culled."""
+        x, y, w, h = bounds
+        self.bounds = (x - self.margin, y - self.margin, x + w + self.margin, y + h + self.margin)
+
+    def count(self, owner):
+        return self.live[owner]
+
+    def spawn(self, x, y, target_x, target_y, owner):
+        if self.live[owner] >= self.limits.get(owner, self.capacity):
+            self.capped += 1
+            return -1
+        if self._free_top == 0:
+            self.dropped += 1
+            return -1
+        self._free_top -= 1
+        index = self._free[self._free_top]
+
+        angle = math.atan2(target_y - y, target_x - x)
+        self.pos[index] = (x, y)
+        self.prev[index] = (x, y)
+        self.vel[index] = (math.cos(angle) * self.speed, math.sin(angle) * self.speed)
+        self.owner[index] = owner
+        self.alive[index] = True
+        self.age[index] = 0
+        self.live[owner] += 1
+        return index
+
+    def kill(self, indices):
+        indices = indices[self.alive[indices]]
+        count = len(indices)
+        if not count:
+            return 0
+        self.alive[indices] = False
+        self._free[self._free_top:self._free_top + count] = indices
+        self._free_top += count
+        enemy = int(np.count_nonzero(self.owner[indices]))
+        self.live[ENEMY] -= enemy
+        self.live[PLAYER] -= count - enemy
+        return count
+
+    def clear(self):
+        self.alive[:] = False
+        self._free[:] = np.arange(self.capacity - 1, -1, -1, dtype=np.int32)
+        self._free_top = self.capacity
+        self.live = [0, 0]
+
+    def nbytes(self):
+        return sum(array.nbytes for array in (self.pos, self.prev, self.vel, self.owner,
+                                              self.alive, self.age, self._free))
+
+    def stats(self):
+        return {
+            "player": self.live[PLAYER],
+            "enemy": self.live[ENEMY],
+            "dropped": self.dropped,
+            "capped": self.capped,
+            "culled": self.culled,
+            "expired": self.expired,
+            "bytes": self.nbytes(),
+        }
+
+    def _retire(self, live):
+        """Kill bullets that left the world or outlived ``ttl``; return the rest."""
+        left, top, right, bottom = self.bounds
+        x, y = self.pos[live, 0], self.pos[live, 1]
+        outside = (x < left) | (x > right) | (y < top) | (y > bottom)
+        old = self.age[live] >= self.ttl
+        self.culled += self.kill(live[outside])
+        self.expired += self.kill(live[old & ~outside])
+        return live[~(outside | old)]
+
+    def update(self, player, occupancy, enemy_grid):
+        live = np.flatnonzero(self.alive)
+        if not len(live):
+            return
+        self.prev[live] = self.pos[live]
+        self.pos[live] += self.vel[live]
+        self.age[live] += 1
+        live = self._retire(live)
+
+        (block_hit, blocks), player_hit, (enemy_hit, enemies) = self._hit_tests(live, player, occupancy, enemy_grid)
+        if len(block_hit):
+            sound_bank.play("boxhit")
+            for index in blocks:
+                event_log.emit(Event.BULLET_HIT_BLOCK, *occupancy.items[index].rect.topleft)
+            self.kill(block_hit)
+
+        for _ in player_hit:
+            player.hp -= self.damage
+            event_log.emit(Event.BULLET_HIT_PLAYER, player.hp)
+            sound_bank.play("playerdamaged")
+        self.kill(player_hit)
+
+        for index in enemies:
+            enemy = enemy_grid.items[index]
+            enemy.hp -= self.damage
+            event_log.emit(Event.BULLET_HIT_ENEMY, enemy.hp)
+            sound_bank.play("enemyhit")
+        self.kill(enemy_hit)
+
+    def hits(self, player, occupancy, enemy_grid):
+        """Run ``update``'s hit tests on the current positions without changing anything.
+
+        Returns ``((bullets, blocks), bullets, (bullets, enemies))``: the
+        bullets stopped by a block and the block indices, the enemy bullets
+        hitting the player, and the player bullets hitting an enemy with
+        the enemy indices into ``enemy_grid.items``.
+        """
+        return self._hit_tests(np.flatnonzero(self.alive), player, occupancy, enemy_grid)
+
+    def _hit_tests(self, live, player, occupancy, enemy_grid):
+        half = self.size / 2
+        x, y = self.pos[live, 0], self.pos[live, 1]
+        block_hit = occupancy.first_overlap(x, y, half)
+        blocked = block_hit >= 0
+        blocks = (live[blocked], block_hit[blocked])
+
+        live = live[~blocked]
+        x, y = self.pos[live, 0], self.pos[live, 1]
+        player_bounds = (player.rect.left, player.rect.top, player.rect.right, player.rect.bottom)
+        player_hit = live[(self.owner[live] == ENEMY) & overlaps(x, y, half, player_bounds)]
+
+        live = live[self.owner[live] == PLAYER]
+        enemy_hit = first_overlap(self.pos[live, 0], self.pos[live, 1], half, enemy_grid)
+        hit = enemy_hit >= 0
+        return blocks, player_hit, (live[hit], enemy_hit[hit])
+
+    def render_items(self, alpha=1.0, view=None):
+        """``(key, surface, rect)`` for every live bullet, for the dirty-rect renderer.
+
+        Positions are interpolated ``alpha`` of the way from the previous tick.
+        With a world rect ``view`` only bullets inside it are returned, in
+        coordinates relative to its top-left corner.
+        """
+        half = self.size / 2
+        items = []
+        for owner in (ENEMY, PLAYER):
+            texture = self.textures[owner]
+            live = np.flatnonzero(self.alive & (self.owner == owner))
+            previous = self.prev[live]
+            corners = previous + (self.pos[live] - previous) * alpha - half
+            if view is not None:
+                corners -= view.topleft
+                inside = ((corners[:, 0] > -self.size) & (corners[:, 0] < view.w)
+                          & (corners[:, 1] > -self.size) & (corners[:, 1] < view.h))
+                live, corners = live[inside], corners[inside]
+            items += [(("bullet", index), texture, pygame.Rect(x, y, self.size, self.size))
+                      for index, (x, y) in zip(live.tolist(), corners.tolist())]
+        return items
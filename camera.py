@@ -0,0 +1,27 @@
+import pygame
+
+
+class Camera:
+    """Window-sized view onto the world that follows a point and stays inside it."""
+
+    def __init__(self, width, height, world):
+        self.rect = pygame.Rect(0, 0, width, height)
+        self.world = pygame.Rect(world)
+
+    @property
+    def offset(self):
+        return self.rect.topleft
+
+    def follow(self, x, y):
+        """Centre on ``(x, y)``; returns True if the view moved."""
+        old = self.rect.topleft
+        self.rect.center = (round(x), round(y))
+        if self.world.w >= self.rect.w and self.world.h >= self.rect.h:
+            self.rect.clamp_ip(self.world)
+        else:
+            self.rect.topleft = (max(min(self.rect.x, self.world.right - self.rect.w), self.world.x),
+                                 max(min(self.rect.y, self.world.bottom - self.rect.h), self.world.y))
+        return self.rect.topleft != old
+
+    def to_screen(self, rect):
+        return rect.move(-self.rect.x, -self.rect.y)
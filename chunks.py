@@ -0,0 +1,60 @@
+import pygame
+from texture_cache import texture_cache
+
+
+class ChunkMap:
+    """The level's static layer pre-rendered into square chunk surfaces.
+
+    The background texture is tiled across the world and the blocks are
+    drawn on top once, when the level is baked. Drawing the view then only
+    blits the few chunks that intersect the camera.
+    """
+
+    def __init__(self, level, blocks, chunk_size=256):
+        self.chunk_size = chunk_size
+        self.cols = -(-level.width // chunk_size)
+        self.rows = -(-level.height // chunk_size)
+        self.world = level.rect
+        self.surfaces = {}
+        background = texture_cache.get(level.background, level.background_size)
+        for cx in range(self.cols):
+            for cy in range(self.rows):
+                area = pygame.Rect(cx * chunk_size, cy * chunk_size, chunk_size, chunk_size).clip(self.world)
+                self.surfaces[cx, cy] = self._bake(area, background, blocks)
+
+    @staticmethod
+    def _bake(area, background, blocks):
+        surface = pygame.Surface(area.size).convert() if pygame.display.get_surface() else pygame.Surface(area.size)
+        tile_w, tile_h = background.get_size()
+        for x in range(area.left // tile_w * tile_w, area.right, tile_w):
+            for y in range(area.top // tile_h * tile_h, area.bottom, tile_h):
+                surface.blit(background, (x - area.left, y - area.top))
+        for block in blocks:
+            if block.rect.colliderect(area):
+                surface.blit(block.image, block.rect.move(-area.left, -area.top))
+        return surface
+
+    def keys(self, rect, margin=0):
+        """Chunk coordinates overlapping ``rect`` plus ``margin`` chunks on every side."""
+        size = self.chunk_size
+        left = max(rect.left // size - margin, 0)
+        top = max(rect.top // size - margin, 0)
+        right = min((rect.right - 1) // size + margin, self.cols - 1)
+        bottom = min((rect.bottom - 1) // size + margin, self.rows - 1)
+        return [(cx, cy) for cx in range(left, right + 1) for cy in range(top, bottom + 1)]
+
+    def area(self, rect, margin=0):
+        """World rect covered by the chunks ``keys(rect, margin)`` returns."""
+        keys = self.keys(rect, margin)
+        if not keys:
+            return pygame.Rect(0, 0, 0, 0)
+        size = self.chunk_size
+        (left, top), (right, bottom) = keys[0], keys[-1]
+        return pygame.Rect(left * size, top * size, (right - left + 1) * size,
+                           (bottom - top + 1) * size).clip(self.world)
+
+    def draw(self, target, view):
+        """Blit the chunks visible through the world rect ``view`` onto ``target``."""
+        size = self.chunk_size
+        target.blits([(self.surfaces[key], (key[0] * size - view.x, key[1] * size - view.y))
+                      for key in self.keys(view)], doreturn=False)
@@ -1,22 +1,24 @@
-import logging
+import pygame
 from settings import win_width, win_height
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+from event_log import event_log, Event
 
 class CollisionHandler:
-    @staticmethod
-    def check_collision(movable, blocks):
-        for block in blocks:
+    def __init__(self, world=(0, 0, win_width, win_height)):
+        self.world = pygame.Rect(world)
+
+    def check_collision(self, movable, block_grid):
+        for block in block_grid.query_rect(movable.rect.inflate(movable.rect.w, movable.rect.h)):
             if movable.rect.colliderect(block.rect):
-                logging.info("Зіткнення з блоком на позиції %s", block.rect.topleft)
+                event_log.emit(Event.BLOCK_CONTACT, *block.rect.topleft)
                 CollisionHandler.resolve_collision(movable, block)
-        if movable.rect.left < 0:
-            movable.rect.left = 0
-        if movable.rect.right > win_width:
-            movable.rect.right = win_width
-        if movable.rect.top < 0:
-            movable.rect.top = 0
-        if movable.rect.bottom > win_height:
-            movable.rect.bottom = win_height
+        if movable.rect.left < self.world.left:
+            movable.rect.left = self.world.left
+        if movable.rect.right > self.world.right:
+            movable.rect.right = self.world.right
+        if movable.rect.top < self.world.top:
+            movable.rect.top = self.world.top
+        if movable.rect.bottom > self.world.bottom:
+            movable.rect.bottom = self.world.bottom
 
     @staticmethod
     def resolve_collision(movable, block):
@@ -1,62 +1,77 @@
 import pygame
-import random
-from abc import ABC, abstractmethod
-import math
-import os
-from game_sprites import GameSprite, Movable, Bullet
+from abc import abstractmethod
+from game_sprites import Drawable, Movable
 from settings import *
-import logging
-from pygame import mixer
-def load_death_animation(scale_to):
-    frames = []
-    for i in range(7):
-        path = f"animations/explosion/{i}.png"
-        frame = pygame.image.load(path).convert_alpha()
+from event_log import event_log, Event
+from sound_bank import sound_bank
+from animations import animation_registry
+from texture_cache import texture_cache
+from steering import steer_chasers, steer_kiters
+from bullets import ENEMY
+class EnemyBase(Drawable, Movable):
+    """One enemy record.
+
+    Everything shared by a kind of enemy (texture, size, speed, ranges) is
+    a class attribute of its archetype; instances carry only mutable state
+    in ``__slots__`` and are recycled by ``EnemyStore`` through ``reset``.
+    """
+
+    __slots__ = ("id", "store", "alive", "rect", "image", "hp",
+                 "animation_index", "animation_timer", "cooldown_timer")
+    kind = None
+    steer = None
+    texture = None
+    size = (50, 50)
+    speed = 1
+    max_hp = 1
+    death_animation = ("explosion", (50, 50))
 
-        scaled_frame = pygame.transform.scale(frame, scale_to)
-        frames.append(scaled_frame)
-    return frames
-
-
-class EnemyBase(GameSprite, Movable, ABC):
+    def __init__(self, x, y):
+        self.id = -1
+        self.store = None
+        self.rect = pygame.Rect((0, 0), self.size)
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        self.alive = True
+        self.image = texture_cache.get(self.texture, self.size)
+        self.rect.center = (x, y)
+        self.hp = self.max_hp
+        self.animation_index = 0
+        self.animation_timer = 0
+        self.cooldown_timer = 0
 
-    def __init__(self, image, x, y, w, h, speed, hp, dead):
-        super().__init__(image, x, y, w, h)
-        self.speed = speed
-        self.hp = hp
-        self.dead = False
-        self.animation_index = 0 
-        self.animation_timer = 0 
+    def kill(self):
+        if self.alive:
+            self.alive = False
+            if self.store is not None:
+                self.store.released(self)
 
+    def draw(self, win):
+        win.blit(self.image, self.rect)
 
-        self.death_animation = load_death_animation((w, h))  
     @abstractmethod
-    def attack(self, player):
+    def attack(self, player, bullets):
         pass
 
-    @abstractmethod
-    def move(self, player, blocks):
-        pass
+    def move(self, player, block_grid, enemy_grid):
+        self.steer([self], player, block_grid, enemy_grid)
 
-    def update(self, player, blocks, enemies):
+    def update(self, player, bullets):
         if self.hp > 0:
-            self.move(player, blocks, enemies)
-            self.attack(player)
+            self.attack(player, bullets)
         else:
             self.play_death_animation()
 
     def play_death_animation(self):
-        sound = mixer.Sound('sounds/enemydeath.ogg')
-        sound.set_volume(0.1)
-        sound.play()
-        if self.animation_index < len(self.death_animation):
+        if self.animation_index == 0 and self.animation_timer <= 0:
+            sound_bank.play("enemydeath")
+        if self.animation_index < animation_registry.frame_count(self.death_animation[0]):
             if self.animation_timer <= 0:
 
-                current_frame = self.death_animation[self.animation_index]
+                current_frame = animation_registry.frame(*self.death_animation, self.animation_index)
                 self.image = current_frame
 
-                win.blit(current_frame, self.rect.topleft)
-
                 self.animation_index += 1
                 self.animation_timer = 0.5
             else:
@@ -65,138 +80,38 @@ class EnemyBase(GameSprite, Movable, ABC):
             self.kill()
 
 class Zombie(EnemyBase):
-    def __init__(self, x, y):
-        super().__init__(zombie_image, x, y, 50, 50, speed=2, hp=30, dead=False)
-
-    def move(self, player, blocks, other_enemies):
-        dx = player.rect.centerx - self.rect.centerx
-        dy = player.rect.centery - self.rect.centery
-        angle = math.atan2(dy, dx)
-
-        new_x = self.rect.x + math.cos(angle) * self.speed
-        new_y = self.rect.y + math.sin(angle) * self.speed
-        new_rect = self.rect.move(new_x - self.rect.x, new_y - self.rect.y)
-
-        for block in blocks:
-            if new_rect.colliderect(block.rect):
-
-                if random.choice([True, False]): 
-                    angle += math.pi / 2 
-                else:
-                    angle -= math.pi / 2 
-                
-
-                new_x = self.rect.x + math.cos(angle) * self.speed
-                new_y = self.rect.y + math.sin(angle) * self.speed
-                new_rect = self.rect.move(new_x - self.rect.x, new_y - self.rect.y)
-
-
-                if new_rect.colliderect(block.rect):
-                    return
-        for other in other_enemies:
-            if other is not self:
-                distance_to_other = math.hypot(
-                    other.rect.centerx - self.rect.centerx,
-                    other.rect.centery - self.rect.centery
-                )
-                if distance_to_other < 70:
-                    peer_dx = self.rect.centerx - other.rect.centerx
-                    peer_dy = self.rect.centery - other.rect.centery
-                    peer_avoid_angle = math.atan2(peer_dy, peer_dx)
-
-                    new_x += math.cos(peer_avoid_angle) * self.speed
-                    new_y += math.sin(peer_avoid_angle) * self.speed
-                    new_rect = self.rect.move(new_x - self.rect.x, new_y - self.rect.y)
-
-
-
-        self.rect.x = new_x
-        self.rect.y = new_y
-
-    def attack(self, player):
+    __slots__ = ()
+    steer = staticmethod(steer_chasers)
+    texture = zombie_image
+    speed = 2
+    max_hp = 30
+    peer_distance = 70
+
+    def attack(self, player, bullets):
         if self.rect.colliderect(player.rect):
             self.kill()
             player.hp -= 10
-            sound = mixer.Sound('sounds/saw.ogg')
-            sound.set_volume(0.1)
-            sound.play()
+            sound_bank.play("saw")
 
 
 class Shooter(EnemyBase):
-    def __init__(self, x, y):
-        super().__init__(shooter_image, x, y, 50, 50, speed=1, hp=20, dead=False)
-        self.shot_cooldown = 60
-        self.cooldown_timer = 0
-        self.avoidance_distance = 50
-        self.peer_distance = 70
-
-    def move(self, player, blocks, other_enemies):
-
-        distance_to_player = math.hypot(
-            player.rect.centerx - self.rect.centerx,
-            player.rect.centery - self.rect.centery
-        )
-
-
-        if distance_to_player < 200:
-            dx = self.rect.centerx - player.rect.centerx
-            dy = self.rect.centery - player.rect.centery
-        else:
-            dx = player.rect.centerx - self.rect.centerx
-            dy = player.rect.centery - self.rect.centery
-
-        angle = math.atan2(dy, dx)
-
-        new_x = self.rect.x + math.cos(angle) * self.speed
-        new_y = self.rect.y + math.sin(angle) * self.speed
-        new_rect = self.rect.move(new_x - self.rect.x, new_y - self.rect.y)
-
-
-        for block in blocks:
-            if self.rect.colliderect(block.rect.inflate(self.avoidance_distance, self.avoidance_distance)):
-
-                block_dx = self.rect.centerx - block.rect.centerx
-                block_dy = self.rect.centery - block.rect.centery
-                avoid_angle = math.atan2(block_dy, block_dx)
-
-                new_x += math.cos(avoid_angle) * self.speed
-                new_y += math.sin(avoid_angle) * self.speed
-                new_rect = self.rect.move(new_x - self.rect.x, new_y - self.rect.y)
-
-                if new_rect.colliderect(block.rect):
-                    return
-
-
-        for other in other_enemies:
-            if other is not self:
-                distance_to_other = math.hypot(
-                    other.rect.centerx - self.rect.centerx,
-                    other.rect.centery - self.rect.centery
-                )
-                if distance_to_other < 70:
-
-                    peer_dx = self.rect.centerx - other.rect.centerx
-                    peer_dy = self.rect.centery - other.rect.centery
-                    peer_avoid_angle = math.atan2(peer_dy, peer_dx)
-
-                    new_x += math.cos(peer_avoid_angle) * self.speed
-                    new_y += math.sin(peer_avoid_angle) * self.speed
-                    new_rect = self.rect.move(new_x - self.rect.x, new_y - self.rect.y)
-
-
-        self.rect.x = new_x
-        self.rect.y = new_y
-
-    def attack(self, player):
-        from game_manager import GameManager
+    __slots__ = ()
+    steer = staticmethod(steer_kiters)
+    texture = shooter_image
+    speed = 1
+    max_hp = 20
+    shot_cooldown = 60
+    avoidance_distance = 50
+    peer_distance = 70
+    flee_distance = 200
+
+    def attack(self, player, bullets):
         if self.cooldown_timer <= 0:
-            bullet = Bullet(
+            bullets.spawn(
                 self.rect.centerx, self.rect.centery,
-                player.rect.centerx, player.rect.centery,
-                enemybullet_image
+                player.rect.centerx, player.rect.centery, ENEMY
             )
-            GameManager.instance.add_enemy_bullet(bullet)
             self.cooldown_timer = self.shot_cooldown
-            logging.info("Стрілець випустив кулю")
+            event_log.emit(Event.SHOOTER_SHOT)
         else:
             self.cooldown_timer -= 1
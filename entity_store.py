@@ -0,0 +1,81 @@
+from factory import EnemyFactory
+
+
+class EnemyStore:
+    """Every enemy record ever created, indexed by entity id.
+
+    Killing an enemy only flags its record; the dense list of living
+    enemies is compacted the next time the store is read and the record
+    goes on its kind's free list, so ``spawn`` reuses it instead of
+    building a new object. Iteration order is spawn order.
+    """
+
+    def __init__(self):
+        self.records = []
+        self._live = []
+        self._free = {}
+        self._dead = 0
+        self.created = 0
+        self.reused = 0
+
+    def __len__(self):
+        self._compact()
+        return len(self._live)
+
+    def __iter__(self):
+        self._compact()
+        return iter(self._live)
+
+    def spawn(self, enemy_type, x, y):
+        self._compact()
+        free = self._free.get(enemy_type)
+        if free:
+            record = self.records[free.pop()]
+            record.reset(x, y)
+            self.reused += 1
+        else:
+            record = EnemyFactory.create_enemy(enemy_type, x, y)
+            self._adopt(record)
+        self._live.append(record)
+        return record
+
+    def add(self, *records):
+        """Take ownership of records created outside the store."""
+        for record in records:
+            self._adopt(record)
+            self._live.append(record)
+
+    def _adopt(self, record):
+        record.id = len(self.records)
+        record.store = self
+        self.records.append(record)
+        self.created += 1
+
+    def released(self, record):
+        self._dead += 1
+
+    def empty(self):
+        for record in self._live:
+            record.kill()
+        self._compact()
+
+    def _compact(self):
+        if not self._dead:
+            return
+        live = []
+        for record in self._live:
+            if record.alive:
+                live.append(record)
+            else:
+                self._free.setdefault(record.kind, []).append(record.id)
+        self._live = live
+        self._dead = 0
+
+    def stats(self):
+        return {
+            "live": len(self),
+            "records": len(self.records),
+            "free": sum(len(ids) for ids in self._free.values()),
+            "created": self.created,
+            "reused": self.reused,
+        }
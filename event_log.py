@@ -0,0 +1,165 @@
+import atexit
+import logging
+import threading
+import time
+from enum import IntEnum
+
+
+class Event(IntEnum):
+    GAME_STARTED = 0
+    PLAYER_CREATED = 1
+    PLAYER_SHOT = 2
+    SHOOTER_SHOT = 3
+    BLOCK_CONTACT = 4
+    BULLET_HIT_BLOCK = 5
+    BULLET_HIT_PLAYER = 6
+    BULLET_HIT_ENEMY = 7
+    PLAYER_DIED = 8
+    GAME_WON = 9
+
+
+MESSAGES = {
+    Event.GAME_STARTED: "Гра розпочата",
+    Event.PLAYER_CREATED: "Гравець створений на позиції (%d, %d)",
+    Event.PLAYER_SHOT: "Гравець випустив кулю",
+    Event.SHOOTER_SHOT: "Стрілець випустив кулю",
+    Event.BLOCK_CONTACT: "Зіткнення з блоком на позиції (%d, %d)",
+    Event.BULLET_HIT_BLOCK: "Куля влучила в блок на позиції (%d, %d)",
+    Event.BULLET_HIT_PLAYER: "Куля влучила у гравця. Здоров'я: %d",
+    Event.BULLET_HIT_ENEMY: "Куля влучила у ворога. Здоров'я: %d",
+    Event.PLAYER_DIED: "Гравець загинув. Кінець гри.",
+    Event.GAME_WON: "Вітаємо! Ви перемогли!",
+}
+
+# (keep one in every N, at most M per second; 0 means unlimited)
+DEFAULT_POLICY = {
+    Event.BLOCK_CONTACT: (10, 5),
+    Event.BULLET_HIT_BLOCK: (1, 20),
+    Event.SHOOTER_SHOT: (1, 20),
+    Event.PLAYER_SHOT: (1, 20),
+    Event.BULLET_HIT_ENEMY: (1, 50),
+}
+
+
+class EventLog:
+    """Structured gameplay log that keeps formatting and I/O off the game loop.
+
+    ``emit`` only applies the per-type sampling and rate limit and writes
+    the event into a preallocated ring buffer. A background thread drains
+    the buffer into the ``game.events`` logger. When the buffer is full new
+    events are dropped and counted rather than blocking the game.
+    """
+
+    def __init__(self, capacity=4096, policy=None, interval=0.1):
+        self.capacity = capacity
+        self.interval = interval
+        self.logger = logging.getLogger("game.events")
+
+        self._kinds = [0] * capacity
+        self._times = [0.0] * capacity
+        self._args = [()] * capacity
+        self._head = 0
+        self._tail = 0
+
+        size = len(Event)
+        self._every = [1] * size
+        self._limit = [0] * size
+        self._seen = [0] * size
+        self._window = [0] * size
+        self._in_window = [0] * size
+        for kind, (every, limit) in (policy if policy is not None else DEFAULT_POLICY).items():
+            self.set_policy(kind, every, limit)
+
+        self.sampled_out = 0
+        self.rate_limited = 0
+        self.dropped = 0
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def set_policy(self, kind, every=1, per_second=0):
+        self._every[kind] = max(1, every)
+        self._limit[kind] = per_second
+
+    def emit(self, kind, *args):
+        seen = self._seen[kind] = self._seen[kind] + 1
+        if seen % self._every[kind]:
+            self.sampled_out += 1
+            return
+
+        now = time.time()
+        limit = self._limit[kind]
+        if limit:
+            window = int(now)
+            if window != self._window[kind]:
+                self._window[kind] = window
+                self._in_window[kind] = 0
+            if self._in_window[kind] >= limit:
+                self.rate_limited += 1
+                return
+            self._in_window[kind] += 1
+
+        head = self._head
+        if head - self._tail >= self.capacity:
+            self.dropped += 1
+            return
+        slot = head % self.capacity
+        self._kinds[slot] = kind
+        self._times[slot] = now
+        self._args[slot] = args
+        self._head = head + 1
+
+    def pending(self):
+        return self._head - self._tail
+
+    def flush(self):
+        """Write every buffered event to the logger."""
+        with self._lock:
+            head = self._head
+            logger = self.logger
+            enabled = logger.isEnabledFor(logging.INFO)
+            for index in range(self._tail, head):
+                slot = index % self.capacity
+                if enabled:
+                    kind = self._kinds[slot]
+                    record = logger.makeRecord(logger.name, logging.INFO, __file__, 0,
+                                               MESSAGES[kind], self._args[slot], None)
+                    record.created = self._times[slot]
+                    record.msecs = (record.created % 1) * 1000
+                    record.event = Event(kind).name
+                    logger.handle(record)
+                self._args[slot] = ()
+            self._tail = head
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._drain, name="event-log", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        if self._thread is None:
+            return
+        thread, self._thread = self._thread, None
+        self._wake.set()
+        thread.join()
+        self._wake.clear()
+        self.flush()
+
+    def _drain(self):
+        while self._thread is not None:
+            self._wake.wait(self.interval)
+            self.flush()
+
+    def stats(self):
+        return {
+            "pending": self.pending(),
+            "sampled_out": self.sampled_out,
+            "rate_limited": self.rate_limited,
+            "dropped": self.dropped,
+        }
+
+
+event_log = EventLog()
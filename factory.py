@@ -1,9 +1,20 @@
 from enemies import Zombie, Shooter
 
 class EnemyFactory:
+    types = {}
+
+    @staticmethod
+    def register(enemy_type, archetype):
+        """Make ``archetype`` (an ``EnemyBase`` subclass) creatable as ``enemy_type``."""
+        archetype.kind = enemy_type
+        EnemyFactory.types[enemy_type] = archetype
+
     @staticmethod
     def create_enemy(enemy_type, x, y):
-        if enemy_type == "zombie":
-            return Zombie(x, y)
-        elif enemy_type == "shooter":
-            return Shooter(x, y)
+        enemy_class = EnemyFactory.types.get(enemy_type)
+        if enemy_class is not None:
+            return enemy_class(x, y)
+
+
+EnemyFactory.register("zombie", Zombie)
+EnemyFactory.register("shooter", Shooter)
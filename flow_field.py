@@ -0,0 +1,125 @@
+import numpy as np
+
+# (dx, dy) of the eight neighbouring cells; diagonals come last.
+STEPS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+UNREACHABLE = np.iinfo(np.int32).max
+
+
+def dilate(mask, radius):
+    """Grow the True cells of ``mask`` by ``radius`` cells in every direction."""
+    grown = mask.copy()
+    for _ in range(radius):
+        step = grown.copy()
+        step[1:, :] |= grown[:-1, :]
+        step[:-1, :] |= grown[1:, :]
+        step[:, 1:] |= grown[:, :-1]
+        step[:, :-1] |= grown[:, 1:]
+        grown = step
+    return grown
+
+
+class FlowField:
+    """Shared path towards one goal for every agent on a tile grid.
+
+    A breadth-first search from the goal cell gives each cell its step
+    distance; every cell then points at its closest neighbour. The field
+    is rebuilt only when the goal moves to another cell, and agents read
+    their direction with one array lookup.
+
+    Solid tiles are grown by ``clearance`` pixels so the field never leads
+    an agent of that half-size into a corner it cannot fit past.
+    """
+
+    def __init__(self, solid, tile_size, clearance=25):
+        self.tile_size = tile_size
+        self.rows, self.cols = solid.shape
+        self.solid = solid
+        self.blocked = dilate(solid, -(-clearance // tile_size))
+        self.distance = np.full(solid.shape, UNREACHABLE, dtype=np.int32)
+        self.dx = np.zeros(solid.shape, dtype=np.float64)
+        self.dy = np.zeros(solid.shape, dtype=np.float64)
+        self.goal = None
+        self.rebuilds = 0
+
+    def cell(self, x, y):
+        col = min(max(int(x // self.tile_size), 0), self.cols - 1)
+        row = min(max(int(y // self.tile_size), 0), self.rows - 1)
+        return col, row
+
+    def update(self, x, y):
+        """Point the field at the world position ``(x, y)``; True if it was rebuilt."""
+        goal = self.cell(x, y)
+        if goal == self.goal:
+            return False
+        self.goal = goal
+        self.rebuilds += 1
+        self._search(goal)
+        self._directions()
+        return True
+
+    def _search(self, goal):
+        col, row = goal
+        # The goal and the open tiles right around it are always enterable,
+        # even when the target stands closer to a wall than the clearance.
+        open_ = ~self.blocked
+        open_[max(row - 1, 0):row + 2, max(col - 1, 0):col + 2] |= ~self.solid[max(row - 1, 0):row + 2,
+                                                                             max(col - 1, 0):col + 2]
+        open_[row, col] = True
+
+        distance = self.distance
+        distance[:] = UNREACHABLE
+        distance[row, col] = 0
+        frontier = np.zeros_like(open_)
+        frontier[row, col] = True
+        visited = frontier.copy()
+        step = 0
+        while frontier.any():
+            step += 1
+            grown = np.zeros_like(frontier)
+            grown[1:, :] |= frontier[:-1, :]
+            grown[:-1, :] |= frontier[1:, :]
+            grown[:, 1:] |= frontier[:, :-1]
+            grown[:, :-1] |= frontier[:, 1:]
+            frontier = grown & open_ & ~visited
+            visited |= frontier
+            distance[frontier] = step
+
+    def _directions(self):
+        rows, cols = self.rows, self.cols
+        padded = np.full((rows + 2, cols + 2), UNREACHABLE, dtype=np.int64)
+        padded[1:-1, 1:-1] = self.distance
+        open_ = np.zeros((rows + 2, cols + 2), dtype=bool)
+        open_[1:-1, 1:-1] = self.distance != UNREACHABLE
+
+        best = np.full((rows, cols), UNREACHABLE, dtype=np.int64)
+        self.dx[:] = 0.0
+        self.dy[:] = 0.0
+        for dx, dy in STEPS:
+            neighbour = padded[1 + dy:rows + 1 + dy, 1 + dx:cols + 1 + dx].copy()
+            if dx and dy:
+                # No cutting corners past a blocked orthogonal neighbour.
+                corner_free = (open_[1 + dy:rows + 1 + dy, 1:cols + 1]
+                               & open_[1:rows + 1, 1 + dx:cols + 1 + dx])
+                neighbour[~corner_free] = UNREACHABLE
+            better = neighbour < best
+            best[better] = neighbour[better]
+            self.dx[better] = dx
+            self.dy[better] = dy
+
+        length = np.hypot(self.dx, self.dy)
+        moving = length > 0
+        self.dx[moving] /= length[moving]
+        self.dy[moving] /= length[moving]
+        # Cells that cannot get any closer have no direction.
+        stuck = best >= self.distance
+        self.dx[stuck] = 0.0
+        self.dy[stuck] = 0.0
+
+    def directions(self, x, y):
+        """Unit steps and goal distances (in cells) for arrays of world positions.
+
+        The step is (0, 0) where the field has no direction.
+        """
+        col = np.clip((x // self.tile_size).astype(np.intp), 0, self.cols - 1)
+        row = np.clip((y // self.tile_size).astype(np.intp), 0, self.rows - 1)
+        return self.dx[row, col], self.dy[row, col], self.distance[row, col]
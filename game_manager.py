@@ -1,19 +1,47 @@
+import os
 import pygame
 import random
 import logging
-from game_sprites import Player, Block, Bullet
+import time
+from game_sprites import Player
 from enemies import Zombie, Shooter
-from factory import EnemyFactory
 from collision import CollisionHandler
-from input_handler import InputHandler
+from bullets import BulletSystem, PLAYER, ENEMY
+from spatial_grid import SpatialGrid
+from level import Level, OccupancyGrid
+from flow_field import FlowField
+from entity_store import EnemyStore
+from ai_scheduler import AIScheduler
+from chunks import ChunkMap
+from camera import Camera
+from steering import steer_all
+from profiler import profiler, resident_memory
+from event_log import event_log, Event
+from renderer import DirtyRenderer
+from text_cache import text_cache, HudValue
+from app import app
+from input_handler import InputHandler, InputRecorder, Recording
 from ui import Button
-from settings import player_image, block_image, zombie_image, shooter_image, enemybullet_image, win_width, win_height, background_image
-from pygame import mixer
+from settings import player_image, block_image, zombie_image, shooter_image, enemybullet_image, playerbullet_image, win_width, win_height, SIM_RATE, level_path
+from texture_cache import texture_cache
+from animations import animation_registry
+from sound_bank import sound_bank
+from preloader import AssetPreloader, ASSETS_READY
+
+PRELOAD_TEXTURES = [
+    (player_image, (50, 50)),
+    (block_image, (100, 50)),
+    (zombie_image, (50, 50)),
+    (shooter_image, (50, 50)),
+    (enemybullet_image, (10, 10)),
+    (playerbullet_image, (10, 10)),
+]
+PRELOAD_ANIMATIONS = [("explosion", (50, 50))]
+PRELOAD_SHEETS = [(player_image, (50, 50), 72)]
+
+
 class GameManager:
-    instance = None
-    
-    def __init__(self, win):
-        self.__class__.instance = self
+    def __init__(self, win, seed=None, record_path=None, level=level_path):
         self.win = win
         self.win_width, self.win_height = self.win.get_size()
 
@@ -26,15 +54,43 @@ class GameManager:
         self.menu_sound_played = False
         self.lost_sound_played = False
         self.win_sound_played = False
+        self.painted_screen = None
 
         self.blocks = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
-        self.enemy_bullets = pygame.sprite.Group()
-        self.player_bullets = pygame.sprite.Group()
+        self.enemies = EnemyStore()
+        self.bullets = BulletSystem(bounds=self.win.get_rect())
+        self.block_grid = SpatialGrid(cell_size=100, margin=8)
+        self.occupancy = None
+        self.flow_field = None
+        self.enemy_grid = SpatialGrid(cell_size=100, margin=16)
         self.player = None
+        self.level_path = level
+        self.level = None
+        self.wave = 0
+        self.chunks = None
+        self.camera = None
+        self.active_area = None
+        self.active_count = 0
+        self.scheduler = AIScheduler()
+        self.preloader = AssetPreloader()
+        self.view_background = pygame.Surface(self.win.get_size())
+        self.view_origin = None
 
         self.collision_handler = CollisionHandler()
-        
+        self.input_source = InputHandler()
+        self.input_handler = self.input_source
+        self.rng = random.Random()
+        self.fixed_seed = seed
+        self.seed = None
+        self.record_path = record_path
+        self.recording = None
+        self.sessions = 0
+        self.renderer = DirtyRenderer(self.win)
+        self.hp_text = HudValue("HP: {}", 36, (255, 0, 0))
+        self.previous_centers = {}
+        self.ticks = 0
+        self.memory = 0
+
 
         button_width, button_height = 200, 80
         self.start_button = Button(
@@ -52,9 +108,20 @@ class GameManager:
             text='Restart'
         )
 
-    def start_game(self):
+    def start_game(self, seed=None):
 
-        mixer.stop()
+        self._finish_recording()
+        if seed is None:
+            seed = self.fixed_seed if self.fixed_seed is not None else random.randrange(1 << 63)
+        self.seed = Recording.check_seed(seed)
+        self.rng.seed(seed)
+        if self.record_path:
+            self.recording = Recording(seed)
+            self.input_handler = InputRecorder(self.input_source, self.recording)
+        else:
+            self.input_handler = self.input_source
+
+        sound_bank.stop_all()
         self.game_running = True
         self.game_over = False
         self.game_won = False
@@ -65,137 +132,273 @@ class GameManager:
         self.lost_sound_played = False
         self.win_sound_played = False
 
-        logging.info("Гра розпочата")
+        event_log.emit(Event.GAME_STARTED)
+        # Enemy records are recycled, so centres from the last session would be interpolated from.
+        self.previous_centers = {}
+        self.preloader.finish()
+        self._install_preloaded()
         self._create_objects()
 
-    def _create_objects(self):
+    def preload(self):
+        """Start decoding the level's assets on a worker thread while a static screen shows."""
+        if self.chunks is None:
+            self.preloader.start(self.level_path, PRELOAD_TEXTURES, PRELOAD_ANIMATIONS, PRELOAD_SHEETS,
+                                 sounds=["mainmenu"])
+
+    def _install_preloaded(self):
+        if not self.preloader.pump():
+            return
+        if self.level is None and self.preloader.level is not None:
+            self.level = self.preloader.level
+        if not self.preloader.active and self.level is not None and self.chunks is None:
+            # Everything the bake needs is cached now; doing it here keeps it off the Start click.
+            level = self.level
+            self.chunks = app.timed("chunks", lambda: ChunkMap(level, level.create_blocks()))
+            app.timings["sounds"] = sound_bank.decode_time
+            app.report()
+        self.request_repaint()
 
-        self.player = Player(player_image, 350, 450, 50, 50, 5)
+    def _create_objects(self):
 
+        texture_cache.preload(PRELOAD_TEXTURES)
+        animation_registry.preload(PRELOAD_ANIMATIONS)
+        for path, size, steps in PRELOAD_SHEETS:
+            texture_cache.rotation_sheet(path, size, steps)
+        if self.level is None:
+            self.level = app.timed("level", lambda: Level.load(self.level_path))
+        level = self.level
+        self.player = Player(player_image, *level.player, 50, 50, 5)
+
+        self.place_blocks(level.create_blocks())
+        if self.chunks is None:
+            self.chunks = app.timed("chunks", lambda: ChunkMap(level, self.blocks))
+        self.collision_handler.world = level.rect
+        self.bullets.set_bounds(level.rect)
+        self.camera = Camera(self.win_width, self.win_height, level.rect)
+        self.camera.follow(*self.player.rect.center)
+        self._update_active_area()
+        self._update_view()
 
+        self.enemies.empty()
+        self.bullets.clear()
+        self.wave = 0
+        self.scheduler.reset()
+        level.spawn_wave(self.wave, self.rng, self.enemies)
+
+    def place_blocks(self, blocks):
+        """Replace the static blocks and rebuild both collision structures."""
+        level = self.level
         self.blocks.empty()
-        block_positions = [
-        (100, 300), 
-        (300, 250),  
-        (500, 350), 
-        (200, 400), 
-        ]
+        self.blocks.add(*blocks)
+        self.block_grid.rebuild(self.blocks)
+        self.occupancy = OccupancyGrid(level.tile_size, level.cols, level.rows)
+        self.occupancy.rebuild(self.blocks)
+        self.flow_field = FlowField(self.occupancy.owner >= 0, level.tile_size)
 
-        for pos in block_positions:
-            block = Block(block_image, pos[0], pos[1], 100, 50)
-            self.blocks.add(block)
+    def _update_active_area(self):
+        self.active_area = self.chunks.area(self.camera.rect, margin=1)
 
+    def _update_view(self):
+        self.view_origin = self.camera.rect.topleft
+        self.chunks.draw(self.view_background, self.camera.rect)
+        self.renderer.set_background(self.view_background)
 
+    def update(self):
+        self.tick()
+        self.render()
 
-        self.enemies.empty()
-        for _ in range(3):
-            enemy = EnemyFactory.create_enemy("zombie", random.randint(50, 550), random.randint(50, 160))
-            self.enemies.add(enemy)
-        for _ in range(5):
-            enemy = EnemyFactory.create_enemy("shooter", random.randint(50, 550), random.randint(50, 160))
-            self.enemies.add(enemy)
+    def tick(self):
+        if self.game_running:
+            self.simulate()
 
-    def update(self):
+    def render(self, alpha=1.0):
+
+        if self.game_running:
+            self.painted_screen = None
+            self.draw(alpha)
+            return
 
+        # Static screens are only repainted when they change or are exposed.
+        screen = self.current_screen()
+        if screen == self.painted_screen:
+            return
+        self.painted_screen = screen
         if self.game_over:
             self.draw_game_over_screen()
         elif self.game_won:
             self.draw_win_screen()
-        elif self.game_running:
-            self._run_game()
         else:
             self._display_start_message()
 
-    def _run_game(self):
-        self.win.blit(background_image, (0, 0))
-
-
-        self.blocks.draw(self.win)
-        self.player.update(InputHandler(), self.blocks, self.collision_handler)
-        self.player.draw(self.win)
-
-        for enemy in self.enemies:
-            enemy.update(self.player, self.blocks, self.enemies)
-            enemy.draw(self.win)
-
-        for bullet in self.enemy_bullets:
-            bullet.update(self.player, self.blocks)
-            bullet.draw(self.win)
-
-        for bullet in self.player_bullets:
-            bullet.update(self.player, self.blocks)
-            bullet.draw(self.win)
-
-
-        self._display_player_hp()
+    def current_screen(self):
+        if self.game_over:
+            return "lost"
+        if self.game_won:
+            return "won"
+        return "menu"
+
+    def is_idle(self):
+        return not self.game_running
+
+    def request_repaint(self):
+        self.painted_screen = None
+
+    def simulate(self):
+        self.previous_centers = {sprite: sprite.rect.center for sprite in self.enemies}
+        self.previous_centers[self.player] = self.player.rect.center
+        self.input_handler.begin_tick()
+        self.player.update(self.input_handler, self.block_grid, self.collision_handler, self.bullets)
+        self.camera.follow(*self.player.rect.center)
+        self._update_active_area()
+        profiler.lap("player")
+        self.flow_field.update(*self.player.rect.center)
+        profiler.lap("flow_field")
+
+        # Living enemies outside the chunks around the camera stay dormant.
+        awake = [enemy for enemy in self.enemies
+                 if enemy.hp > 0 and self.active_area.collidepoint(enemy.rect.center)]
+        dying = [enemy for enemy in self.enemies if enemy.hp <= 0]
+        self.active_count = len(awake)
+        self.enemy_grid.rebuild(self.enemies)
+        profiler.lap("grid")
+        thinking = self.scheduler.begin(awake, self.camera.rect, self.player)
+        steer_all(thinking, self.player, self.block_grid, self.enemy_grid, self.rng, self.flow_field)
+        profiler.lap("steering")
+        for enemy in thinking:
+            enemy.update(self.player, self.bullets)
+        self.scheduler.end()
+        for enemy in dying:
+            enemy.update(self.player, self.bullets)
+        profiler.lap("enemies")
+
+        self.bullets.update(self.player, self.occupancy, self.enemy_grid)
+        profiler.lap("bullets")
+        self._record_gauges()
 
         if self.player.hp <= 0:
-            logging.info("Гравець загинув. Кінець гри.")
+            event_log.emit(Event.PLAYER_DIED)
             self.game_running = False
             self.game_over = True
-
-        if len(self.enemies) == 0:
-            logging.info("Вітаємо! Ви перемогли!")
+            self._finish_recording()
+
+        if len(self.enemies) == 0 and self.wave + 1 < len(self.level.waves):
+            self.wave += 1
+            for record in self.level.spawn_wave(self.wave, self.rng, self.enemies):
+                self.previous_centers.pop(record, None)
+        elif len(self.enemies) == 0:
+            event_log.emit(Event.GAME_WON)
             self.game_running = False
             self.game_won = True
+            self._finish_recording()
+
+    def _record_gauges(self):
+        if self.ticks % SIM_RATE == 0:
+            self.memory = resident_memory()
+        self.ticks += 1
+        profiler.count("enemies", len(self.enemies))
+        profiler.count("active", self.active_count)
+        profiler.count("ai_run", self.scheduler.scheduled)
+        profiler.count("ai_deferred", self.scheduler.deferred)
+        profiler.count("ai_skipped", self.scheduler.skipped)
+        profiler.count("player_bullets", self.bullets.count(PLAYER))
+        profiler.count("enemy_bullets", self.bullets.count(ENEMY))
+        profiler.count("bullet_kb", self.bullets.nbytes() // 1024)
+        profiler.count("rss_mb", self.memory // (1024 * 1024))
+        profiler.count("sounds_dropped", sound_bank.dropped)
+        profiler.count("sounds_stolen", sound_bank.stolen)
+
+    def draw(self, alpha=1.0):
+        camera = self.camera
+        player_rect = self._interpolated_rect(self.player, alpha)
+        # simulate() moves the camera too, so compare with where the view was baked.
+        camera.follow(*player_rect.center)
+        if camera.rect.topleft != self.view_origin:
+            self._update_view()
+        items = [(self.player, self.player.image, camera.to_screen(player_rect))]
+        for enemy in self.enemies:
+            rect = self._interpolated_rect(enemy, alpha)
+            if rect.colliderect(camera.rect):
+                items.append((enemy, enemy.image, camera.to_screen(rect)))
+        profiler.lap("draw_sprites")
+        items += self.bullets.render_items(alpha, camera.rect)
+        profiler.lap("draw_bullets")
+        items.append(self._display_player_hp())
+        overlay = profiler.render_overlay()
+        if overlay is not None:
+            items.append(("profiler", overlay, overlay.get_rect(topleft=(5, 5))))
+        profiler.lap("draw_hud")
+        self.renderer.render(items)
+        profiler.lap("draw_blit")
+
+    def _interpolated_rect(self, sprite, alpha):
+        previous = self.previous_centers.get(sprite)
+        if previous is None or alpha >= 1.0:
+            return sprite.rect
+        x, y = sprite.rect.center
+        rect = sprite.rect.copy()
+        rect.center = (round(previous[0] + (x - previous[0]) * alpha), round(previous[1] + (y - previous[1]) * alpha))
+        return rect
+
+    def present(self):
+        self.renderer.present()
 
     def _display_player_hp(self):
 
-        font = pygame.font.Font(None, 36) 
-        hp_text = f"HP: {self.player.hp}"  
-        text_surface = font.render(hp_text, True, (255, 0, 0)) 
+        text_surface = self.hp_text.render(self.player.hp)
         text_rect = text_surface.get_rect(topright=(self.win_width - 10, 10)) 
-        self.win.blit(text_surface, text_rect) 
+        return "hp", text_surface, text_rect
     def draw_game_over_screen(self):
 
         self.win.fill((0, 0, 0))
 
         if not self.lost_sound_played:
-            mixer.stop()
-            sound = mixer.Sound('sounds/lost.ogg')
-            sound.set_volume(0.1)
-            sound.play()
+            sound_bank.stop_all()
+            sound_bank.play("lost")
             self.lost_sound_played = True
 
         self._draw_centered_text("Ви програли!", 30, (255, 0, 0), self.win_height // 2 - 100)
         self.restart_button.draw(self.win)
-        pygame.display.flip()
+        self.renderer.repainted()
 
     def draw_win_screen(self):
 
         self.win.fill((0, 0, 0))
 
         if not self.win_sound_played:
-            mixer.stop()
-            sound = mixer.Sound('sounds/won.ogg')
-            sound.set_volume(0.1)
-            sound.play()
+            sound_bank.stop_all()
+            sound_bank.play("won")
             self.win_sound_played = True
 
         self._draw_centered_text("Ви перемогли!", 30, (0, 255, 0), self.win_height // 2 - 100)
         self.restart_button.draw(self.win)
-        pygame.display.flip()
+        self.renderer.repainted()
 
     def _display_start_message(self):
 
         self.win.fill((0, 0, 0))
-        self.win.blit(background_image, (0, 0))
+        self.win.blit(app.background, (0, 0))
 
-        if not self.menu_sound_played:
-            mixer.stop()
-            sound = mixer.Sound('sounds/mainmenu.ogg')
-            sound.set_volume(0.1)
-            sound.play()
+        # While the preloader is still decoding the music, wait for it instead of blocking the menu.
+        if not self.menu_sound_played and (sound_bank.ready("mainmenu") or not self.preloader.active):
+            sound_bank.stop_all()
+            sound_bank.play("mainmenu")
             self.menu_sound_played = True
 
         self._draw_centered_text("Shooter", 50, (255, 255, 255), 50)
         self.start_button.draw(self.win)
-        pygame.display.flip()
+        if self.preloader.active:
+            self._draw_progress(self.preloader.progress)
+        self.renderer.repainted()
+
+    def _draw_progress(self, fraction):
+        bar = pygame.Rect(0, 0, 200, 6)
+        bar.midtop = (self.win_width // 2, self.start_button.rect.bottom + 20)
+        pygame.draw.rect(self.win, (255, 255, 255), bar, 1)
+        pygame.draw.rect(self.win, (255, 255, 255), (bar.x, bar.y, round(bar.width * fraction), bar.height))
 
     def _draw_centered_text(self, text, size, color, y):
 
-        font = pygame.font.Font(None, size)
-        text_surface = font.render(text, True, color)
+        text_surface = text_cache.render(text, size, color)
         text_rect = text_surface.get_rect(center=(self.win_width // 2, y))
         self.win.blit(text_surface, text_rect)
 
@@ -203,18 +406,52 @@ class GameManager:
     def handle_events(self, event):
 
         if event.type == pygame.QUIT:
+            self._finish_recording()
             pygame.quit()
             exit()
         elif self.start_button.is_clicked(event) and not self.game_running:
             self.start_game() 
         elif self.restart_button.is_clicked(event) and (self.game_over or self.game_won):
             self.start_game()
-
-    def add_enemy_bullet(self, bullet):
-        self.enemy_bullets.add(bullet)
-    
-    def add_player_bullet(self, bullet):
-        self.player_bullets.add(bullet)
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            profiler.toggle_overlay()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+            self._export_profile()
+        elif event.type == pygame.MOUSEMOTION and self.is_idle():
+            button = self.start_button if self.current_screen() == "menu" else self.restart_button
+            if button.update_hover(event.pos):
+                self.request_repaint()
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+            self.request_repaint()
+        elif event.type == ASSETS_READY:
+            self._install_preloaded()
+
+    def _export_profile(self):
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        profiler.export_chrome_trace(f"profile-{stamp}.json")
+        profiler.export_csv(f"profile-{stamp}.csv")
+        logging.info("Профіль збережено: profile-%s", stamp)
+
+    def set_input(self, handler):
+        self.input_source = handler
+        self.input_handler = handler
+
+    def _session_path(self):
+        """``record_path`` with a session number before the extension, never an existing file."""
+        base, ext = os.path.splitext(self.record_path)
+        while True:
+            self.sessions += 1
+            path = f"{base}-{self.sessions}{ext}"
+            if not os.path.exists(path):
+                return path
+
+    def _finish_recording(self):
+        if self.recording is not None:
+            path = self._session_path()
+            self.recording.save(path)
+            logging.info("Запис сесії збережено: %s (%d тактів)", path, len(self.recording))
+            self.recording = None
+            self.input_handler = self.input_source
 
     def is_running(self):
 
@@ -3,16 +3,21 @@ import pygame
 from settings import *
 import random
 import math
-import logging
-from pygame import mixer
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+from sound_bank import sound_bank
+from texture_cache import texture_cache
+from event_log import event_log, Event
+from bullets import PLAYER
 
 class Drawable(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def draw(self, win):
         pass
 
 class Movable(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def move(self, *args):
         pass
@@ -20,14 +25,21 @@ class Movable(ABC):
 class GameSprite(pygame.sprite.Sprite, Drawable):
     def __init__(self, image, x, y, w, h):
         super().__init__()
-        self.image = pygame.transform.scale(pygame.image.load(image), (w, h))
+        self.texture = (image, (w, h))
+        self.angle = 0
+        self.image = texture_cache.get(image, (w, h))
         self.rect = self.image.get_rect(center=(x, y))
 
     def draw(self, win):
         win.blit(self.image, self.rect)
     
     def rotate(self, angle):
-        self.image = pygame.transform.rotate(self.image, angle)
+        self.set_angle(self.angle + angle)
+
+    def set_angle(self, angle):
+        """Face ``angle`` degrees counter-clockwise using the texture's rotation sheet."""
+        self.angle = angle % 360
+        self.image = texture_cache.rotation_sheet(*self.texture).frame(self.angle)
         self.rect = self.image.get_rect(center=self.rect.center)
 
 class Player(GameSprite, Movable):
@@ -39,7 +51,7 @@ class Player(GameSprite, Movable):
         self.shot_cooldown = 10  
         self.cooldown_timer = 0 
 
-        logging.info("Гравець створений на позиції (%d, %d)", x, y)
+        event_log.emit(Event.PLAYER_CREATED, x, y)
 
     def move(self, keys):
         old_position = self.rect.topleft
@@ -60,87 +72,38 @@ class Player(GameSprite, Movable):
 
 
         if new_angle != self.last_angle:
-            self.rotate(new_angle - self.last_angle)  
+            self.set_angle(new_angle)
             self.last_angle = new_angle 
 
-    def shoot(self):
+    def shoot(self, bullets):
         """Fire a bullet in the direction the player is facing."""
         if self.cooldown_timer <= 0: 
 
-            from game_manager import GameManager
-            sound = mixer.Sound('sounds/shoot.ogg')
-            sound.set_volume(0.1)
-            sound.play()
+            sound_bank.play("shoot")
             angle = math.radians(self.last_angle)
-            bullet = Bullet(
+            bullets.spawn(
                 self.rect.centerx, self.rect.centery, 
                 self.rect.centerx + math.cos(angle) * 100,
                 self.rect.centery - math.sin(angle) * 100,
-                playerbullet_image 
+                PLAYER
             )
-            GameManager.instance.add_player_bullet(bullet) 
             self.cooldown_timer = self.shot_cooldown 
-            logging.info("Гравець випустив кулю")
+            event_log.emit(Event.PLAYER_SHOT)
 
-    def update(self, input_handler, blocks, collision_handler):
+    def update(self, input_handler, block_grid, collision_handler, bullets):
         self.move(input_handler.get_keys())
 
 
         if input_handler.get_keys()[pygame.K_SPACE]:
-            self.shoot()
+            self.shoot(bullets)
 
 
         if self.cooldown_timer > 0:
             self.cooldown_timer -= 1
 
-        collision_handler.check_collision(self, blocks)
+        collision_handler.check_collision(self, block_grid)
 
 
 
 class Block(GameSprite):
     pass
-
-class Bullet(GameSprite):
-
-    def __init__(self, x, y, target_x, target_y, bullet_image):
-        super().__init__(bullet_image, x, y, 10, 10)
-        self.speed = 10
-        dx = target_x - x
-        dy = target_y - y
-        angle = math.atan2(dy, dx)
-        self.velocity_x = math.cos(angle) * self.speed
-        self.velocity_y = math.sin(angle) * self.speed
-
-    def move(self, blocks):
-
-        self.rect.x += self.velocity_x
-        self.rect.y += self.velocity_y
-
-        # Check collision with blocks
-        for block in blocks:
-            if self.rect.colliderect(block.rect):
-                sound = mixer.Sound('sounds/boxhit.ogg')
-                sound.set_volume(0.1)
-                sound.play()
-                logging.info("Куля влучила в блок на позиції %s", block.rect.topleft)
-                self.kill()  # Remove bullet if it hits a block
-
-    def update(self, player, blocks):
-        from game_manager import GameManager
-        self.move(blocks)
-        if self.rect.colliderect(player.rect) and self in GameManager.instance.enemy_bullets:
-            player.hp -= 5
-            logging.info("Куля влучила у гравця. Здоров'я: %d", player.hp)
-            sound = mixer.Sound('sounds/playerdamaged.ogg')
-            sound.set_volume(0.1)
-            sound.play()
-            self.kill()
-        else:
-            for enemy in GameManager.instance.enemies:
-                if self.rect.colliderect(enemy.rect) and self in GameManager.instance.player_bullets:
-                    enemy.hp -= 5
-                    logging.info("Куля влучила у ворога. Здоров'я: %d", enemy.hp)
-                    sound = mixer.Sound('sounds/enemyhit.ogg')
-                    sound.set_volume(0.1)
-                    sound.play()
-                    self.kill()
\ No newline at end of file
@@ -0,0 +1,91 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import logging
+from game_manager import GameManager
+from input_handler import ScriptedInput, ReplayInput, Recording
+from sound_bank import sound_bank
+from app import app
+from settings import level_path
+
+
+class HeadlessGame:
+    """Runs the simulation without a window, sound or frame limiter.
+
+    Import this module before anything touches ``app.display`` so the
+    dummy SDL drivers are picked up.
+    """
+
+    def __init__(self, render=False, quiet=True, seed=None, level=level_path):
+        self.render = render
+        if quiet:
+            logging.disable(logging.INFO)
+        sound_bank.enabled = False
+
+        self.game = GameManager(app.display, seed=seed, level=level)
+        self.input = ScriptedInput()
+        self.game.set_input(self.input)
+        self.ticks = 0
+        self.reset()
+
+    def reset(self, seed=None):
+        self.game.set_input(self.input)
+        self.game.start_game(seed)
+        self.ticks = 0
+        return self.state()
+
+    def replay(self, recording):
+        """Re-run a recorded session as fast as possible and return the final state."""
+        if not isinstance(recording, Recording):
+            recording = Recording.load(recording)
+        replay = ReplayInput(recording)
+        self.game.set_input(replay)
+        self.game.start_game(recording.seed)
+        self.ticks = 0
+        while self.game.game_running and not replay.finished():
+            self.game.simulate()
+            if self.render:
+                self.game.draw()
+            self.ticks += 1
+        state = self.state()
+        self.game.set_input(self.input)
+        return state
+
+    def step(self, n_ticks=1, inputs=()):
+        """Advance up to ``n_ticks`` ticks and return the resulting state.
+
+        ``inputs`` is either one collection of held key codes used for every
+        tick, or a sequence with one collection per tick. Stepping stops
+        early when the game is won or lost.
+        """
+        per_tick = isinstance(inputs, (list, tuple)) and len(inputs) > 0 and not isinstance(inputs[0], int)
+        for tick in range(n_ticks):
+            if not self.game.game_running:
+                break
+            self.input.set_keys(inputs[min(tick, len(inputs) - 1)] if per_tick else inputs)
+            self.game.simulate()
+            if self.render:
+                self.game.draw()
+            self.ticks += 1
+        return self.state()
+
+    def state(self):
+        game = self.game
+        player = game.player
+        return {
+            "tick": self.ticks,
+            "running": game.game_running,
+            "game_over": game.game_over,
+            "game_won": game.game_won,
+            "wave": game.wave,
+            "player": {"x": player.rect.centerx, "y": player.rect.centery, "hp": player.hp},
+            "enemies": [
+                {"type": enemy.kind, "x": enemy.rect.centerx,
+                 "y": enemy.rect.centery, "hp": enemy.hp}
+                for enemy in game.enemies
+            ],
+            "bullets": len(game.bullets),
+        }
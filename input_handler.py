@@ -1,5 +1,134 @@
+import struct
 import pygame
 
+TRACKED_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d, pygame.K_SPACE)
+
+
 class InputHandler:
+    """Reads the keyboard once per simulation tick."""
+
+    def __init__(self):
+        self._keys = None
+
+    def begin_tick(self):
+        self._keys = pygame.key.get_pressed()
+
+    def get_keys(self):
+        if self._keys is None:
+            self.begin_tick()
+        return self._keys
+
+
+class KeyState:
+    """Stand-in for ``pygame.key.get_pressed()`` built from a set of key codes."""
+
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class ScriptedInput:
+    """Input handler fed by code instead of the keyboard."""
+
+    def __init__(self):
+        self.keys = KeyState()
+
+    def set_keys(self, pressed):
+        self.keys = pressed if isinstance(pressed, KeyState) else KeyState(pressed)
+
+    def begin_tick(self):
+        pass
+
+    def get_keys(self):
+        return self.keys
+
+
+def encode_keys(keys):
+    mask = 0
+    for bit, key in enumerate(TRACKED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def decode_keys(mask):
+    return KeyState(key for bit, key in enumerate(TRACKED_KEYS) if mask & (1 << bit))
+
+
+class Recording:
+    """One session: the RNG seed plus a one-byte key bitmask per tick."""
+
+    MAGIC = b"SGRP"
+    HEADER = struct.Struct("<4sHQI")
+    VERSION = 1
+
+    def __init__(self, seed, masks=None):
+        self.seed = self.check_seed(seed)
+        self.masks = bytearray(masks or b"")
+
+    def __len__(self):
+        return len(self.masks)
+
+    @staticmethod
+    def check_seed(seed):
+        """Return ``seed`` if the header can store it (unsigned 64-bit), else raise ValueError."""
+        if not 0 <= seed < 1 << 64:
+            raise ValueError(f"seed must be in [0, 2**64), got {seed}")
+        return seed
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.VERSION, self.seed, len(self.masks)))
+            f.write(self.masks)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            magic, version, seed, ticks = cls.HEADER.unpack(f.read(cls.HEADER.size))
+            if magic != cls.MAGIC or version != cls.VERSION:
+                raise ValueError(f"{path} is not a version {cls.VERSION} input recording")
+            return cls(seed, f.read(ticks))
+
+
+class InputRecorder:
+    """Wraps another input handler and records what it reported each tick."""
+
+    def __init__(self, source, recording):
+        self.source = source
+        self.recording = recording
+        self._keys = KeyState()
+
+    def begin_tick(self):
+        self.source.begin_tick()
+        mask = encode_keys(self.source.get_keys())
+        self.recording.masks.append(mask)
+        self._keys = decode_keys(mask)
+
+    def get_keys(self):
+        return self._keys
+
+
+class ReplayInput:
+    """Plays a recording back one tick at a time."""
+
+    _decoded = [decode_keys(mask) for mask in range(1 << len(TRACKED_KEYS))]
+
+    def __init__(self, recording):
+        self.recording = recording
+        self.tick = 0
+        self._keys = KeyState()
+
+    def finished(self):
+        return self.tick >= len(self.recording)
+
+    def begin_tick(self):
+        if not self.finished():
+            self._keys = self._decoded[self.recording.masks[self.tick]]
+        else:
+            self._keys = self._decoded[0]
+        self.tick += 1
+
     def get_keys(self):
-        return pygame.key.get_pressed()
\ No newline at end of file
+        return self._keys
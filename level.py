@@ -0,0 +1,146 @@
+import json
+import numpy as np
+import pygame
+from factory import EnemyFactory
+from game_sprites import Block
+from settings import block_image, background_image, win_width, win_height
+
+SOLID = "#"
+
+
+class Level:
+    """A world loaded from a JSON level file.
+
+    ``tiles`` is a list of equal-length strings, one character per tile,
+    where ``#`` marks solid ground. Solid areas are cut into blocks of at
+    most ``block_tiles`` tiles. ``waves`` is a list of spawn tables; each
+    entry names an ``EnemyFactory`` type, a count and the ``area``
+    ``[left, top, right, bottom]`` its centres are drawn from.
+    """
+
+    def __init__(self, tiles, tile_size=25, block_tiles=(4, 2), player=(350, 450), waves=(),
+                 background=background_image, background_size=(win_width, win_height), name=""):
+        if not tiles or any(len(row) != len(tiles[0]) for row in tiles):
+            raise ValueError("Рядки рівня мають бути однакової довжини")
+        if not waves:
+            raise ValueError("Рівень має містити хоча б одну хвилю")
+        for wave in waves:
+            for spawn in wave:
+                if spawn["enemy"] not in EnemyFactory.types:
+                    raise ValueError(f"Невідомий тип ворога: {spawn['enemy']}")
+
+        self.name = name
+        self.tiles = tiles
+        self.tile_size = tile_size
+        self.block_tiles = tuple(block_tiles)
+        self.player = tuple(player)
+        self.waves = [list(wave) for wave in waves]
+        self.background = background
+        self.background_size = tuple(background_size)
+        self.cols = len(tiles[0])
+        self.rows = len(tiles)
+        self.width = self.cols * tile_size
+        self.height = self.rows * tile_size
+        self.solid = np.array([[char == SOLID for char in row] for row in tiles], dtype=bool)
+
+    @staticmethod
+    def load(path):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return Level(**data)
+
+    @property
+    def rect(self):
+        return pygame.Rect(0, 0, self.width, self.height)
+
+    def block_rects(self):
+        """Cut the solid tiles into rects of at most ``block_tiles``, row by row."""
+        free = self.solid.copy()
+        max_w, max_h = self.block_tiles
+        size = self.tile_size
+        rects = []
+        for row in range(self.rows):
+            for col in range(self.cols):
+                if not free[row, col]:
+                    continue
+                w = 1
+                while w < max_w and col + w < self.cols and free[row, col + w]:
+                    w += 1
+                h = 1
+                while h < max_h and row + h < self.rows and free[row + h, col:col + w].all():
+                    h += 1
+                free[row:row + h, col:col + w] = False
+                rects.append(pygame.Rect(col * size, row * size, w * size, h * size))
+        return rects
+
+    def create_blocks(self):
+        return [Block(block_image, *rect.center, *rect.size) for rect in self.block_rects()]
+
+    def spawn_wave(self, index, rng, store):
+        """Spawn the enemies of wave ``index`` into ``store`` at random points of their areas.
+
+        Returns the spawned records.
+        """
+        spawned = []
+        for spawn in self.waves[index]:
+            left, top, right, bottom = spawn["area"]
+            for _ in range(spawn["count"]):
+                spawned.append(store.spawn(spawn["enemy"], rng.randint(left, right), rng.randint(top, bottom)))
+        return spawned
+
+
+class OccupancyGrid:
+    """Tile grid mapping every solid tile to the block that covers it.
+
+    Point lookups are O(1) array reads, which is what projectiles need.
+    Blocks must be tile-aligned and must not overlap, otherwise lookups
+    would report the wrong block, so ``rebuild`` rejects them.
+    """
+
+    def __init__(self, tile_size, cols, rows):
+        self.tile_size = tile_size
+        self.cols = cols
+        self.rows = rows
+        self.owner = np.full((rows, cols), -1, dtype=np.int32)
+        self.items = []
+        self.bounds = np.zeros((0, 4), dtype=np.float32)
+
+    def rebuild(self, items):
+        self.items = list(items)
+        self.owner[:] = -1
+        size = self.tile_size
+        for index, item in enumerate(self.items):
+            rect = item.rect
+            if rect.left % size or rect.top % size or rect.width % size or rect.height % size:
+                raise ValueError(f"Блок {tuple(rect)} не вирівняно по сітці тайлів {size}")
+            left, top = max(rect.left // size, 0), max(rect.top // size, 0)
+            right, bottom = rect.right // size, rect.bottom // size
+            if (self.owner[top:bottom, left:right] >= 0).any():
+                raise ValueError(f"Блок {tuple(rect)} перекриває інший блок")
+            self.owner[top:bottom, left:right] = index
+        self.bounds = np.array([(i.rect.left, i.rect.top, i.rect.right, i.rect.bottom) for i in self.items],
+                               dtype=np.float32).reshape(-1, 4)
+
+    def first_overlap(self, x, y, half):
+        """For each centre return the index of a block its square overlaps, or -1.
+
+        ``half`` must not exceed half a tile, so checking the four corners
+        finds every tile the square touches.
+        """
+        result = np.full(len(x), -1, dtype=np.intp)
+        if not self.items or not len(x):
+            return result
+        # All four corners at once, one row per corner; the first corner that hits wins.
+        dx = np.array([[-half], [half], [-half], [half]], dtype=x.dtype)
+        dy = np.array([[-half], [-half], [half], [half]], dtype=y.dtype)
+        col = np.floor((x + dx) / self.tile_size).astype(np.intp)
+        row = np.floor((y + dy) / self.tile_size).astype(np.intp)
+        inside = (col >= 0) & (col < self.cols) & (row >= 0) & (row < self.rows)
+        owner = np.full(col.shape, -1, dtype=np.intp)
+        owner[inside] = self.owner[row[inside], col[inside]]
+        bounds = self.bounds[owner]
+        hit = ((owner >= 0) & (x + half > bounds[..., 0]) & (x - half < bounds[..., 2])
+               & (y + half > bounds[..., 1]) & (y - half < bounds[..., 3]))
+        any_hit = hit.any(axis=0)
+        result[any_hit] = owner[hit.argmax(axis=0)[any_hit], any_hit]
+        return result
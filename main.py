@@ -1,18 +1,81 @@
+import argparse
 import pygame
+import logging
+import time
 from game_manager import GameManager
-from settings import win_width, win_height, background_image, FPS
-clock = pygame.time.Clock()
-def main():
-    pygame.init()
-    win = pygame.display.set_mode((win_width, win_height))
-    game_manager = GameManager(win)
+from settings import SIM_RATE, RENDER_FPS, MAX_CATCH_UP_TICKS, IDLE_WAIT_MS, level_path
+from app import app
+from profiler import profiler
+from event_log import event_log
+from input_handler import Recording
+def main(seed=None, record_path=None, level=level_path):
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    event_log.start()
+    game_manager = GameManager(app.display, seed=seed, record_path=record_path, level=level)
+    # Timing-driven AI budgets are not reproducible, so recorded sessions use the fixed estimate.
+    game_manager.scheduler.adaptive = record_path is None
+    # The startup report is logged once the preload has finished.
+    game_manager.preload()
+    pygame.event.set_blocked([pygame.MOUSEBUTTONUP, pygame.TEXTINPUT, pygame.ACTIVEEVENT])
 
+    tick_length = 1.0 / SIM_RATE
+    accumulator = 0.0
+    previous = time.perf_counter()
     while True:
+        if game_manager.is_idle():
+            idle(game_manager)
+            previous = time.perf_counter()
+            accumulator = 0.0
+            continue
+
+        profiler.begin_frame()
+        now = time.perf_counter()
+        accumulator += now - previous
+        previous = now
+
         for event in pygame.event.get():
             game_manager.handle_events(event)
-        game_manager.update()
-        pygame.display.flip()
-        clock.tick(FPS)
+        profiler.lap("events")
+
+        ticks = 0
+        while accumulator >= tick_length and ticks < MAX_CATCH_UP_TICKS:
+            game_manager.tick()
+            accumulator -= tick_length
+            ticks += 1
+        if ticks == MAX_CATCH_UP_TICKS:
+            accumulator = min(accumulator, tick_length)
+        profiler.count("ticks", ticks)
+
+        game_manager.render(accumulator / tick_length)
+        profiler.lap("render")
+        game_manager.present()
+        profiler.lap("flip")
+        app.clock.tick(RENDER_FPS)
+        profiler.lap("wait")
+        profiler.end_frame()
+
+
+def idle(game_manager):
+    """Menu and end screens: sleep until an event arrives, repaint only if needed."""
+    game_manager.render()
+    game_manager.present()
+    event = pygame.event.wait(IDLE_WAIT_MS)
+    if event.type != pygame.NOEVENT:
+        game_manager.handle_events(event)
+    for event in pygame.event.get():
+        game_manager.handle_events(event)
+
+def seed_argument(text):
+    try:
+        return Recording.check_seed(int(text))
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error))
+
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed", type=seed_argument, help="fixed RNG seed for every session")
+    parser.add_argument("--record", metavar="PATH", help="record each session's inputs to PATH, numbered per session (PATH-1, PATH-2, ...)")
+    parser.add_argument("--level", default=level_path, help="level file to play")
+    args = parser.parse_args()
+    main(seed=args.seed, record_path=args.record, level=args.level)
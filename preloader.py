@@ -0,0 +1,169 @@
+import logging
+import queue
+import threading
+import time
+import pygame
+from asset_bundle import asset_bundle
+from animations import animation_registry
+from level import Level
+from settings import block_image
+from sound_bank import sound_bank
+from texture_cache import texture_cache
+
+# Posted from the loader thread whenever a result is waiting, so an idle
+# screen blocked in ``event.wait`` wakes up to install it.
+ASSETS_READY = pygame.event.custom_type()
+
+
+class AssetPreloader:
+    """Decodes a level's assets on a worker thread while a static screen shows.
+
+    The worker parses the level, loads and scales every texture, renders
+    rotation sheets and decodes sounds, but never touches the caches: each
+    finished asset is queued and ``pump`` installs it on the main thread,
+    where the surface is converted to the display format. Anything not
+    ready by the time it is needed is still loaded on demand as before.
+    """
+
+    def __init__(self):
+        self._thread = None
+        self._results = queue.SimpleQueue()
+        self.level_path = None
+        self.level = None
+        self.total = 0
+        self.done = 0
+        self.failed = 0
+        self.elapsed = 0.0
+        self._animations = []
+        self._running = False
+
+    @property
+    def active(self):
+        """True from ``start`` until the last result has been installed."""
+        return self._running
+
+    @property
+    def progress(self):
+        return self.done / self.total if self.total else 0.0
+
+    def start(self, level_path, textures=(), animations=(), sheets=(), sounds=()):
+        """Begin decoding ``level_path`` plus the listed assets in the background.
+
+        ``sheets`` are ``(path, size, steps)`` rotation sheets; ``sounds`` are
+        names in the order they should be decoded.
+        """
+        if self._running:
+            return
+        asset_bundle.bundle  # opened here so the worker never races the main thread for it
+        textures = list(textures)
+        for name, size in animations:
+            textures += [(path, tuple(size)) for path in animation_registry.paths(name)]
+        if sound_bank.enabled and pygame.mixer.get_init():
+            files = sound_bank.files()
+            sounds = [name for name in dict.fromkeys([*sounds, *files]) if name in files and not sound_bank.ready(name)]
+        else:
+            sounds = []
+
+        self.level_path = level_path
+        self.level = None
+        self.total = 1 + len(sounds)
+        self.done = 0
+        self.failed = 0
+        self._animations = list(animations)
+        self._running = True
+        self._thread = threading.Thread(target=self._work, args=(level_path, textures, list(sheets), sounds),
+                                        name="asset-preloader", daemon=True)
+        self._thread.start()
+
+    def _work(self, level_path, textures, sheets, sounds):
+        start = time.perf_counter()
+        # Sounds go first so the menu music is ready as soon as possible.
+        for name in sounds:
+            self._run("sound", name, lambda: self._decode_sound(name))
+
+        level = self._run("level", level_path, lambda: Level.load(level_path))
+        if level is not None:
+            textures.append((level.background, level.background_size))
+            textures += [(block_image, rect.size) for rect in level.block_rects()]
+        textures = list(dict.fromkeys((path, tuple(size)) for path, size in textures))
+        self._put("total", len(textures) + len(sheets))
+
+        decoded = {}
+        for path, size in textures:
+            decoded[path, size] = self._run("texture", (path, size), lambda: self._decode(path, size))
+        for path, size, steps in sheets:
+            source = decoded.get((path, tuple(size)))
+            self._run("sheet", (path, tuple(size), steps),
+                      lambda: self._rotations(source or self._decode(path, size), steps))
+        self._put("done", time.perf_counter() - start)
+
+    @staticmethod
+    def _decode(path, size):
+        surface = asset_bundle.image(path, size)
+        if surface is None:
+            surface = pygame.transform.scale(pygame.image.load(path), size)
+        return surface
+
+    @staticmethod
+    def _decode_sound(name):
+        start = time.perf_counter()
+        sound = sound_bank.decode(name)
+        return sound, time.perf_counter() - start
+
+    @staticmethod
+    def _rotations(source, steps):
+        return [pygame.transform.rotate(source, i * 360 / steps) for i in range(1, steps)]
+
+    def _run(self, kind, key, build):
+        try:
+            value = build()
+        except Exception as error:
+            logging.warning("Не вдалося підготувати %s: %s", key, error)
+            value = None
+        self._put(kind, key, value)
+        return value
+
+    def _put(self, *result):
+        self._results.put(result)
+        if pygame.display.get_init():
+            pygame.event.post(pygame.event.Event(ASSETS_READY))
+
+    def pump(self):
+        """Install every finished asset on the calling (main) thread; True if anything changed."""
+        changed = False
+        while True:
+            try:
+                kind, *args = self._results.get_nowait()
+            except queue.Empty:
+                return changed
+            changed = True
+            if kind == "total":
+                self.total += args[0]
+            elif kind == "done":
+                self.elapsed = args[0]
+                animation_registry.preload(self._animations)
+                self._thread.join()
+                self._thread = None
+                self._running = False
+                logging.info("Ресурси рівня підготовлено у фоні: %d з %d за %.3f с",
+                             self.done - self.failed, self.total, self.elapsed)
+            else:
+                self._install(kind, *args)
+
+    def _install(self, kind, key, value):
+        self.done += 1
+        if value is None:
+            self.failed += 1
+        elif kind == "level":
+            self.level = value
+        elif kind == "texture":
+            texture_cache.put(*key, value)
+        elif kind == "sheet":
+            texture_cache.put_sheet(*key, value)
+        elif kind == "sound":
+            sound_bank.add(key, *value)
+
+    def finish(self):
+        """Wait for the worker; the next ``pump`` installs everything it produced."""
+        if self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,132 @@
+import csv
+import json
+import os
+import time
+import pygame
+from collections import deque
+
+
+def resident_memory():
+    """Resident set size of this process in bytes, or 0 if it cannot be read."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    # ru_maxrss is the peak, in KiB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+class FrameProfiler:
+    """Per-frame phase timings and entity counts kept in a rolling history.
+
+    ``lap(name)`` charges the time since the previous lap (or the start of
+    the frame) to ``name``; outside ``begin_frame``/``end_frame`` it does
+    nothing, so instrumented code costs almost nothing when unprofiled.
+    """
+
+    def __init__(self, history=600):
+        self.frames = deque(maxlen=history)
+        self.overlay_visible = False
+        self._frame = None
+        self._last = 0.0
+        self._font = None
+
+    def begin_frame(self):
+        now = time.perf_counter()
+        self._frame = {"start": now, "phases": [], "counts": {}}
+        self._last = now
+
+    def lap(self, name):
+        if self._frame is None:
+            return
+        now = time.perf_counter()
+        self._frame["phases"].append((name, self._last, now - self._last))
+        self._last = now
+
+    def count(self, name, value):
+        if self._frame is not None:
+            self._frame["counts"][name] = value
+
+    def end_frame(self):
+        if self._frame is None:
+            return
+        self._frame["duration"] = time.perf_counter() - self._frame["start"]
+        self.frames.append(self._frame)
+        self._frame = None
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+
+    def averages(self, frames=60):
+        recent = list(self.frames)[-frames:]
+        totals = {}
+        for frame in recent:
+            for name, _, duration in frame["phases"]:
+                totals[name] = totals.get(name, 0.0) + duration
+        return {name: total / len(recent) for name, total in totals.items()}
+
+    def render_overlay(self):
+        """Surface with the latest frame time, phase averages and counts, or None."""
+        if not self.overlay_visible or not self.frames:
+            return None
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+
+        last = self.frames[-1]
+        lines = [f"frame {last['duration'] * 1000:6.2f} ms"]
+        lines += [f"{name:<14}{avg * 1000:6.2f} ms" for name, avg in self.averages().items()]
+        lines += [f"{name:<14}{value}" for name, value in last["counts"].items()]
+        rendered = [self._font.render(line, True, (255, 255, 0), (0, 0, 0)) for line in lines]
+        overlay = pygame.Surface((max(line.get_width() for line in rendered), 16 * len(rendered)))
+        for i, line in enumerate(rendered):
+            overlay.blit(line, (0, i * 16))
+        return overlay
+
+    def export_chrome_trace(self, path):
+        """Write the history as Chrome trace-event JSON (chrome://tracing, Perfetto)."""
+        events = []
+        for frame in self.frames:
+            start = frame["start"] * 1e6
+            events.append({"name": "frame", "ph": "X", "ts": start,
+                           "dur": frame["duration"] * 1e6, "pid": 1, "tid": 1})
+            for name, begin, duration in frame["phases"]:
+                events.append({"name": name, "ph": "X", "ts": begin * 1e6,
+                               "dur": duration * 1e6, "pid": 1, "tid": 1})
+            if frame["counts"]:
+                events.append({"name": "entities", "ph": "C", "ts": start, "pid": 1,
+                               "args": frame["counts"]})
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def export_csv(self, path):
+        """Write one row per frame with a millisecond column per phase and count."""
+        phases, counts = [], []
+        for frame in self.frames:
+            for name, _, _ in frame["phases"]:
+                if name not in phases:
+                    phases.append(name)
+            for name in frame["counts"]:
+                if name not in counts:
+                    counts.append(name)
+
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "start", "duration_ms"] + [f"{name}_ms" for name in phases] + counts)
+            for index, frame in enumerate(self.frames):
+                spent = {}
+                for name, _, duration in frame["phases"]:
+                    spent[name] = spent.get(name, 0.0) + duration
+                writer.writerow(
+                    [index, f"{frame['start']:.6f}", f"{frame['duration'] * 1000:.3f}"]
+                    + [f"{spent.get(name, 0.0) * 1000:.3f}" for name in phases]
+                    + [frame["counts"].get(name, "") for name in counts]
+                )
+
+
+profiler = FrameProfiler()
@@ -0,0 +1,96 @@
+import pygame
+
+
+class DirtyRenderer:
+    """Redraws only the parts of the window that changed since the last frame.
+
+    Each frame the caller hands over the full list of ``(key, surface, rect)``
+    items in draw order. Items whose surface and rect are unchanged and that
+    do not overlap anything that changed are left alone; elsewhere the
+    static background is restored, affected items are re-blitted in one
+    ``Surface.blits`` call and only those regions are pushed to the display.
+    When more than ``full_redraw_ratio`` of the window is dirty, or after
+    ``invalidate()``, the whole frame is redrawn and flipped instead.
+    """
+
+    def __init__(self, win, full_redraw_ratio=0.5):
+        self.win = win
+        self.full_redraw_ratio = full_redraw_ratio
+        self.background = None
+        self._previous = {}
+        self._full = True
+        self._dirty = []
+        self.full_redraws = 0
+        self.partial_redraws = 0
+
+    def set_background(self, surface):
+        self.background = surface
+        self.invalidate()
+
+    def invalidate(self):
+        self._full = True
+
+    def repainted(self):
+        """The window was painted outside the renderer; flip it whole."""
+        self._full = True
+        self._previous = {}
+        self._dirty = None
+
+    def render(self, items):
+        items = [(key, surface, pygame.Rect(rect)) for key, surface, rect in items]
+        previous = self._previous
+        current = {key: (surface, rect) for key, surface, rect in items}
+        self._previous = current
+
+        if not self._full:
+            dirty = []
+            changed = set()
+            for key, (surface, rect) in current.items():
+                old = previous.get(key)
+                if old is None or old[0] is not surface or old[1] != rect:
+                    changed.add(key)
+                    dirty.append(rect)
+                    if old is not None:
+                        dirty.append(old[1])
+            for key, (_, rect) in previous.items():
+                if key not in current:
+                    dirty.append(rect)
+
+            area = self.win.get_width() * self.win.get_height()
+            if sum(rect.w * rect.h for rect in dirty) <= area * self.full_redraw_ratio:
+                self._render_partial(items, changed, dirty)
+                return
+
+        self._full = False
+        self.full_redraws += 1
+        if self.background is not None:
+            self.win.blit(self.background, (0, 0))
+        self.win.blits([(surface, rect) for _, surface, rect in items], doreturn=False)
+        self._dirty = None
+
+    def _render_partial(self, items, changed, dirty):
+        self.partial_redraws += 1
+        bounds = self.win.get_rect()
+        dirty = [rect.clip(bounds) for rect in dirty]
+        dirty = [rect for rect in dirty if rect.w and rect.h]
+        redraw = changed
+        growing = True
+        while growing:
+            growing = False
+            for key, _, rect in items:
+                if key not in redraw and rect.collidelist(dirty) != -1:
+                    redraw.add(key)
+                    dirty.append(rect)
+                    growing = True
+
+        if self.background is not None:
+            self.win.blits([(self.background, rect, rect) for rect in dirty], doreturn=False)
+        self.win.blits([(surface, rect) for key, surface, rect in items if key in redraw], doreturn=False)
+        self._dirty = dirty
+
+    def present(self):
+        if self._dirty is None:
+            pygame.display.flip()
+        elif self._dirty:
+            pygame.display.update(self._dirty)
+        self._dirty = []
@@ -0,0 +1,30 @@
+import headless  # selects the dummy SDL drivers before the window is opened
+
+import argparse
+import time
+from headless import HeadlessGame
+from input_handler import Recording
+from settings import level_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded session headless at maximum speed.")
+    parser.add_argument("recording")
+    parser.add_argument("--render", action="store_true", help="also draw every tick offscreen")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--level", default=level_path, help="level the session was recorded on")
+    args = parser.parse_args()
+
+    recording = Recording.load(args.recording)
+    game = HeadlessGame(render=args.render, seed=recording.seed, level=args.level)
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        state = game.replay(recording)
+        elapsed = time.perf_counter() - start
+        print(f"{state['tick']} ticks in {elapsed:.3f} s ({state['tick'] / elapsed:.0f} ticks/s), "
+              f"hp {state['player']['hp']}, enemies {len(state['enemies'])}, "
+              f"{'lost' if state['game_over'] else 'won' if state['game_won'] else 'unfinished'}")
+
+
+if __name__ == "__main__":
+    main()
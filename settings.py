@@ -1,13 +1,12 @@
-import pygame
-
-pygame.init()
-
 win_width = 700
 win_height = 500
-FPS = 20
-
-win = pygame.display.set_mode((win_width, win_height + 50))
-clock = pygame.time.Clock()
+SIM_RATE = 20  # gameplay ticks per second; speeds and timers are per tick
+RENDER_FPS = 60
+MAX_CATCH_UP_TICKS = 5
+IDLE_WAIT_MS = 1000  # longest the menu sleeps waiting for an event
+AI_BUDGET_US = 4000  # enemy AI time per tick; 0 disables the cap
+AI_COST_US = 25  # estimated AI time per enemy
+AI_FAR_INTERVAL = 4  # off-screen enemies think every N ticks
 
 player_image = "textures/player.png"
 block_image = "textures/block.png"
@@ -15,24 +14,9 @@ enemybullet_image = "textures/bullet.png"
 playerbullet_image = "textures/allybullet.png"
 zombie_image = "textures/zombie1.png"
 shooter_image = "textures/zombie2.png"
-
-background_image = pygame.transform.scale(
-                    pygame.image.load('textures/background.png'),
-                    (win_width, win_height)
-                    )
-
-main_background_image = pygame.transform.scale(
-                    pygame.image.load('textures/main_screen.png'),
-                    (win_width, win_height)
-                    )
-
-
-bullets = pygame.sprite.Group()
-enemys = pygame.sprite.Group()
-
+background_image = "textures/background.png"
+main_background_image = "textures/main_screen.png"
+level_path = "levels/level1.json"
+asset_bundle_path = "assets.bundle"  # built by asset_bundle.py; loose files are used without it
 
 background = (150, 150, 100)
-UI = pygame.Rect(0, win_height, win_width, 50)
-ui_font = pygame.font.Font(None, 50)
-
-bt_start_text = ui_font.render("START", True, (100, 255, 255))
\ No newline at end of file
@@ -0,0 +1,132 @@
+import os
+import time
+import logging
+from pygame import mixer
+from asset_bundle import asset_bundle
+
+
+class SoundBank:
+    """Decodes every sound once and plays it through a pool of reserved channels.
+
+    Each sound may have at most ``max_instances`` voices playing at once.
+    When the cap (or the channel pool) is exhausted the new voice is
+    dropped, unless the sound is marked ``steal`` in which case its oldest
+    voice is cut off and reused.
+    """
+
+    def __init__(self, directory="sounds", channels=16, max_instances=3, volume=0.1,
+                 limits=None, steal=()):
+        self.directory = directory
+        self.channel_count = channels
+        self.max_instances = max_instances
+        self.volume = volume
+        self.limits = limits or {}
+        self.steal = set(steal)
+
+        self._files = None
+        self._sounds = {}
+        self._channels = []
+        self._voices = {}
+        self.loaded = False
+        self.enabled = True
+        self.decode_time = 0.0
+        self.dropped = 0
+        self.stolen = 0
+
+    def files(self):
+        """``{name: path}`` of every sound in the directory."""
+        if self._files is None:
+            self._files = {}
+            for file_name in sorted(os.listdir(self.directory)):
+                name, ext = os.path.splitext(file_name)
+                if ext.lower() in (".ogg", ".wav"):
+                    self._files[name] = os.path.join(self.directory, file_name)
+        return self._files
+
+    def decode(self, name):
+        """Decode one sound without adding it; safe to call from a loader thread."""
+        sound = asset_bundle.sound(name)
+        if sound is None:
+            sound = mixer.Sound(self.files()[name])
+        return sound
+
+    def add(self, name, sound, decode_time=0.0):
+        """Take a decoded sound into the bank unless one of that name is already there.
+
+        ``decode_time`` is how long ``decode`` took, wherever it ran.
+        """
+        if name in self._sounds:
+            return
+        if not self._channels:
+            mixer.set_num_channels(max(mixer.get_num_channels(), self.channel_count))
+            mixer.set_reserved(self.channel_count)
+            self._channels = [mixer.Channel(i) for i in range(self.channel_count)]
+        sound.set_volume(self.volume)
+        self._sounds[name] = sound
+        self._voices[name] = []
+        self.decode_time += decode_time
+        self.loaded = len(self._sounds) == len(self.files())
+        if self.loaded:
+            logging.info("Звуки завантажено: %d за %.3f с", len(self._sounds), self.decode_time)
+
+    def ready(self, name):
+        return name in self._sounds
+
+    def play(self, name):
+        if not self.enabled:
+            return None
+        if name not in self._sounds:
+            # Not preloaded yet: decode just this one now.
+            if not mixer.get_init():
+                return None
+            start = time.perf_counter()
+            sound = self.decode(name)
+            self.add(name, sound, time.perf_counter() - start)
+
+        sound = self._sounds[name]
+        voices = [channel for channel in self._voices[name]
+                  if channel.get_busy() and channel.get_sound() is sound]
+        self._voices[name] = voices
+
+        channel = None
+        if len(voices) >= self.limits.get(name, self.max_instances):
+            if name not in self.steal:
+                self.dropped += 1
+                return None
+            channel = voices.pop(0)
+            self.stolen += 1
+        else:
+            for candidate in self._channels:
+                if not candidate.get_busy():
+                    channel = candidate
+                    break
+            if channel is None:
+                if name not in self.steal or not voices:
+                    self.dropped += 1
+                    return None
+                channel = voices.pop(0)
+                self.stolen += 1
+
+        channel.play(sound)
+        voices.append(channel)
+        return channel
+
+    def stop_all(self):
+        for channel in self._channels:
+            channel.stop()
+        for voices in self._voices.values():
+            voices.clear()
+
+    def stats(self):
+        return {
+            "sounds": len(self._sounds),
+            "decode_time": self.decode_time,
+            "dropped": self.dropped,
+            "stolen": self.stolen,
+        }
+
+
+sound_bank = SoundBank(
+    limits={"enemydeath": 2, "mainmenu": 1, "won": 1, "lost": 1},
+    steal=("mainmenu", "won", "lost", "playerdamaged"),
+)
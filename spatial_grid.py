@@ -0,0 +1,110 @@
+import numpy as np
+
+# Below this many point/item pairs, testing every pair at once costs less
+# than the fixed overhead of a grid query.
+DENSE_PAIRS = 4096
+
+
+class SpatialGrid:
+    """Uniform-grid broadphase over sprites with a ``rect``.
+
+    Items are bucketed into every cell their rect (grown by ``margin``)
+    touches. ``margin`` lets callers keep using the grid for a whole tick
+    while items move a few pixels, and lets point queries find rects that
+    a small projectile merely grazes.
+    """
+
+    def __init__(self, cell_size=100, margin=0):
+        self.cell_size = cell_size
+        self.margin = margin
+        self.items = []
+        self._cells = {}
+        self._arrays = None
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def rebuild(self, items):
+        self.items = list(items)
+        self._cells = {}
+        self._arrays = None
+        for index, item in enumerate(self.items):
+            for cell in self._cells_for(item.rect, self.margin):
+                self._cells.setdefault(cell, []).append(index)
+
+    def _cells_for(self, rect, margin=0):
+        size = self.cell_size
+        left = (rect.left - margin) // size
+        right = (rect.right + margin - 1) // size
+        top = (rect.top - margin) // size
+        bottom = (rect.bottom + margin - 1) // size
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                yield cx, cy
+
+    def _candidates(self, x, y, w, h):
+        size = self.cell_size
+        found = set()
+        for cx in range(int(x) // size, int(x + w - 1) // size + 1):
+            for cy in range(int(y) // size, int(y + h - 1) // size + 1):
+                found.update(self._cells.get((cx, cy), ()))
+        return sorted(found)
+
+    def query_rect(self, rect):
+        """Items whose rect overlaps ``rect``, in insertion order."""
+        items = self.items
+        return [items[i] for i in self._candidates(*rect) if items[i].rect.colliderect(rect)]
+
+    def query_radius(self, x, y, radius):
+        """Items whose centre lies strictly within ``radius`` of (x, y)."""
+        items = self.items
+        reach = int(radius) + 1
+        found = []
+        for i in self._candidates(x - reach, y - reach, 2 * reach, 2 * reach):
+            cx, cy = items[i].rect.center
+            if (cx - x) ** 2 + (cy - y) ** 2 < radius * radius:
+                found.append(items[i])
+        return found
+
+    def query_points(self, xs, ys):
+        """Vectorized broadphase for many points at once.
+
+        Returns ``(point_index, item_index)`` arrays listing every item
+        bucketed in the cell of each point, grouped by point and in
+        insertion order within a point.
+        """
+        keys, starts, counts, flat = self._build_arrays()
+        empty = np.zeros(0, dtype=np.intp)
+        if not len(keys) or not len(xs):
+            return empty, empty
+
+        point_keys = self.cell_keys(xs, ys)
+        slot = np.minimum(np.searchsorted(keys, point_keys), len(keys) - 1)
+        per_point = np.where(keys[slot] == point_keys, counts[slot], 0)
+        total = int(per_point.sum())
+        if not total:
+            return empty, empty
+
+        point_index = np.repeat(np.arange(len(xs)), per_point)
+        offsets = np.arange(total) - np.repeat(np.cumsum(per_point) - per_point, per_point)
+        item_index = flat[np.repeat(starts[slot], per_point) + offsets]
+        return point_index, item_index
+
+    def cell_keys(self, xs, ys):
+        """Integer key of the cell holding each point."""
+        cx = np.floor_divide(xs, self.cell_size).astype(np.int64)
+        cy = np.floor_divide(ys, self.cell_size).astype(np.int64)
+        return cx * (1 << 32) + (cy + (1 << 31))
+
+    def _build_arrays(self):
+        if self._arrays is None:
+            cells = sorted((cx * (1 << 32) + cy + (1 << 31), members) for (cx, cy), members in self._cells.items())
+            keys = np.array([key for key, _ in cells], dtype=np.int64)
+            counts = np.array([len(members) for _, members in cells], dtype=np.intp)
+            starts = np.cumsum(counts) - counts
+            flat = np.array([i for _, members in cells for i in members], dtype=np.intp)
+            self._arrays = keys, starts, counts, flat
+        return self._arrays
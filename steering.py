@@ -0,0 +1,197 @@
+import random
+import numpy as np
+from bullets import rects_to_array
+from spatial_grid import DENSE_PAIRS
+
+NEIGHBOUR_CELLS = np.array([(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)], dtype=np.float64)
+
+
+class Swarm:
+    """Snapshot of one group of enemies as NumPy columns."""
+
+    def __init__(self, agents):
+        self.agents = list(agents)
+        rects = np.array([(*agent.rect, *agent.rect.center) for agent in self.agents], dtype=np.float64).reshape(-1, 6)
+        self.x, self.y, self.w, self.h, self.cx, self.cy = rects.T
+        self.speed = self.column("speed")
+
+    def __len__(self):
+        return len(self.agents)
+
+    def column(self, name):
+        kind = type(self.agents[0]) if self.agents else None
+        constant = getattr(kind, name, None)
+        if isinstance(constant, (int, float)) and all(type(agent) is kind for agent in self.agents):
+            # Archetype constant shared by the whole swarm.
+            return np.full(len(self.agents), constant, dtype=np.float64)
+        return np.array([getattr(agent, name) for agent in self.agents], dtype=np.float64)
+
+    def write_back(self, new_x, new_y, moving):
+        for agent, x, y, move in zip(self.agents, new_x.tolist(), new_y.tolist(), moving.tolist()):
+            if move:
+                agent.rect.x = x
+                agent.rect.y = y
+
+
+def nearby_blocks(swarm, block_grid, reach):
+    """Bounds of the blocks close enough to any agent to matter this tick."""
+    left = int(swarm.x.min() - reach)
+    top = int(swarm.y.min() - reach)
+    right = int((swarm.x + swarm.w).max() + reach)
+    bottom = int((swarm.y + swarm.h).max() + reach)
+    area = (left, top, right - left, bottom - top)
+    return rects_to_array(block.rect for block in block_grid.query_rect(area)).astype(np.float64)
+
+
+def overlap_matrix(x, y, w, h, bounds, grow=0):
+    """(agents, blocks) mask of agent rects overlapping blocks grown by ``grow`` per side."""
+    return (
+        (x[:, None] + w[:, None] > bounds[None, :, 0] - grow)
+        & (x[:, None] < bounds[None, :, 2] + grow)
+        & (y[:, None] + h[:, None] > bounds[None, :, 1] - grow)
+        & (y[:, None] < bounds[None, :, 3] + grow)
+    )
+
+
+def neighbour_pairs(swarm, enemy_grid, radius):
+    """Pairs (agent, other) of distinct enemies whose centres are closer than ``radius``.
+
+    ``radius`` is per agent and must not exceed the grid cell size.
+    """
+    if len(swarm) * len(enemy_grid.items) <= DENSE_PAIRS:
+        return dense_neighbour_pairs(swarm, enemy_grid, radius)
+    shift = NEIGHBOUR_CELLS * enemy_grid.cell_size
+    query_x = (swarm.cx + shift[:, :1]).ravel()
+    query_y = (swarm.cy + shift[:, 1:]).ravel()
+    query, item = enemy_grid.query_points(query_x, query_y)
+    if not len(query):
+        return query, item
+
+    # An item is bucketed in every cell its rect touches; only count it
+    # through the cell holding its centre so each pair is seen once.
+    centers = np.array([other.rect.center for other in enemy_grid.items], dtype=np.float64)
+    home = enemy_grid.cell_keys(centers[:, 0], centers[:, 1])
+    once = enemy_grid.cell_keys(query_x, query_y)[query] == home[item]
+    point, item = query[once] % len(swarm), item[once]
+
+    own_index = own_grid_index(swarm, enemy_grid)
+    other_cx, other_cy = centers[item, 0], centers[item, 1]
+    close = np.hypot(other_cx - swarm.cx[point], other_cy - swarm.cy[point]) < radius[point]
+    keep = close & (item != own_index[point])
+    return point[keep], np.stack((other_cx[keep], other_cy[keep]))
+
+
+def dense_neighbour_pairs(swarm, enemy_grid, radius):
+    """``neighbour_pairs`` by testing every (agent, item) pair, for small crowds.
+
+    Pairs come out in the grid path's order (neighbour cell, agent, item),
+    so forces sum identically.
+    """
+    if not len(swarm) or not len(enemy_grid.items):
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty
+    size = enemy_grid.cell_size
+    centers = np.array([other.rect.center for other in enemy_grid.items], dtype=np.float64)
+    dx = np.floor_divide(centers[None, :, 0], size) - np.floor_divide(swarm.cx[:, None], size)
+    dy = np.floor_divide(centers[None, :, 1], size) - np.floor_divide(swarm.cy[:, None], size)
+    close = np.hypot(centers[None, :, 0] - swarm.cx[:, None], centers[None, :, 1] - swarm.cy[:, None]) < radius[:, None]
+    keep = (np.abs(dx) <= 1) & (np.abs(dy) <= 1) & close
+    keep &= np.arange(len(centers))[None, :] != own_grid_index(swarm, enemy_grid)[:, None]
+    point, item = np.nonzero(keep)
+    # nonzero() lists pairs by agent, then item; a stable sort on the cell finishes the order.
+    order = np.argsort((dx[point, item] + 1) * 3 + dy[point, item], kind="stable")
+    point, item = point[order], item[order]
+    return point, np.stack((centers[item, 0], centers[item, 1]))
+
+
+def own_grid_index(swarm, enemy_grid):
+    """Index of each agent in ``enemy_grid.items``, or -1."""
+    grid_index = {id(other): index for index, other in enumerate(enemy_grid.items)}
+    return np.array([grid_index.get(id(agent), -1) for agent in swarm.agents], dtype=np.intp)
+
+
+def separation(swarm, enemy_grid, radius):
+    """Sum of unit pushes away from every close peer, scaled by agent speed."""
+    force_x = np.zeros(len(swarm))
+    force_y = np.zeros(len(swarm))
+    point, other = neighbour_pairs(swarm, enemy_grid, radius)
+    if len(point):
+        angle = np.arctan2(swarm.cy[point] - other[1], swarm.cx[point] - other[0])
+        np.add.at(force_x, point, np.cos(angle) * swarm.speed[point])
+        np.add.at(force_y, point, np.sin(angle) * swarm.speed[point])
+    return force_x, force_y
+
+
+def steer_chasers(agents, player, block_grid, enemy_grid, rng=random, flow_field=None):
+    """Zombie steering: follow the flow field to the player, seeking directly once close.
+
+    Blocks in the way are sidestepped by ±90° and peers are kept apart.
+    """
+    swarm = Swarm(agents)
+    if not len(swarm):
+        return
+    angle = np.arctan2(player.rect.centery - swarm.cy, player.rect.centerx - swarm.cx)
+    if flow_field is not None:
+        dx, dy, distance = flow_field.directions(swarm.cx, swarm.cy)
+        follow = (distance > 2) & ((dx != 0) | (dy != 0))
+        angle[follow] = np.arctan2(dy[follow], dx[follow])
+    new_x = swarm.x + np.cos(angle) * swarm.speed
+    new_y = swarm.y + np.sin(angle) * swarm.speed
+    moving = np.ones(len(swarm), dtype=bool)
+
+    blocks = nearby_blocks(swarm, block_grid, 2 * swarm.speed.max())
+    if len(blocks):
+        blocked = overlap_matrix(new_x, new_y, swarm.w, swarm.h, blocks).any(axis=1)
+        turned = np.flatnonzero(blocked)
+        if len(turned):
+            turn = np.array([rng.choice([1.0, -1.0]) for _ in turned]) * (np.pi / 2)
+            angle[turned] += turn
+            new_x[turned] = swarm.x[turned] + np.cos(angle[turned]) * swarm.speed[turned]
+            new_y[turned] = swarm.y[turned] + np.sin(angle[turned]) * swarm.speed[turned]
+            still = overlap_matrix(new_x[turned], new_y[turned], swarm.w[turned], swarm.h[turned], blocks)
+            moving[turned[still.any(axis=1)]] = False
+
+    push_x, push_y = separation(swarm, enemy_grid, swarm.column("peer_distance"))
+    swarm.write_back(new_x + push_x, new_y + push_y, moving)
+
+
+def steer_kiters(agents, player, block_grid, enemy_grid, rng=random, flow_field=None):
+    """Shooter steering: flee inside ``flee_distance``, otherwise seek; avoid blocks and peers."""
+    swarm = Swarm(agents)
+    if not len(swarm):
+        return
+    to_player_x = player.rect.centerx - swarm.cx
+    to_player_y = player.rect.centery - swarm.cy
+    flee = np.hypot(to_player_x, to_player_y) < swarm.column("flee_distance")
+    direction = np.where(flee, -1.0, 1.0)
+    angle = np.arctan2(to_player_y * direction, to_player_x * direction)
+    new_x = swarm.x + np.cos(angle) * swarm.speed
+    new_y = swarm.y + np.sin(angle) * swarm.speed
+    moving = np.ones(len(swarm), dtype=bool)
+
+    avoidance = swarm.column("avoidance_distance")
+    blocks = nearby_blocks(swarm, block_grid, avoidance.max())
+    if len(blocks):
+        near = overlap_matrix(swarm.x, swarm.y, swarm.w, swarm.h, blocks, grow=avoidance[:, None] / 2)
+        agent, block = np.nonzero(near)
+        if len(agent):
+            block_cx = (blocks[block, 0] + blocks[block, 2]) / 2
+            block_cy = (blocks[block, 1] + blocks[block, 3]) / 2
+            avoid_angle = np.arctan2(swarm.cy[agent] - block_cy, swarm.cx[agent] - block_cx)
+            np.add.at(new_x, agent, np.cos(avoid_angle) * swarm.speed[agent])
+            np.add.at(new_y, agent, np.sin(avoid_angle) * swarm.speed[agent])
+            inside = overlap_matrix(new_x, new_y, swarm.w, swarm.h, blocks) & near
+            moving[inside.any(axis=1)] = False
+
+    push_x, push_y = separation(swarm, enemy_grid, swarm.column("peer_distance"))
+    swarm.write_back(new_x + push_x, new_y + push_y, moving)
+
+
+def steer_all(enemies, player, block_grid, enemy_grid, rng=random, flow_field=None):
+    """Run each enemy class's batched steering once over all of its living members."""
+    groups = {}
+    for enemy in enemies:
+        if enemy.hp > 0:
+            groups.setdefault(type(enemy), []).append(enemy)
+    for enemy_type, agents in groups.items():
+        enemy_type.steer(agents, player, block_grid, enemy_grid, rng, flow_field)
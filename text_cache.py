@@ -0,0 +1,64 @@
+import pygame
+from collections import OrderedDict
+
+
+class TextCache:
+    """Pools fonts by (name, size) and memoizes rendered text surfaces.
+
+    Rendered surfaces are shared and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries=128):
+        self.max_entries = max_entries
+        self._fonts = {}
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size, name=None):
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self._fonts[key] = font
+        return font
+
+    def render(self, text, size, color, name=None, background=None):
+        key = (text, name, size, tuple(color), background and tuple(background))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.font(size, name).render(text, True, color, background)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def stats(self):
+        return {"fonts": len(self._fonts), "entries": len(self._surfaces), "hits": self.hits, "misses": self.misses}
+
+
+text_cache = TextCache()
+
+
+class HudValue:
+    """A line of HUD text that is re-rendered only when its value changes."""
+
+    def __init__(self, template, size, color, name=None):
+        self.template = template
+        self.size = size
+        self.color = color
+        self.name = name
+        self._value = None
+        self.surface = None
+
+    def render(self, value):
+        if self.surface is None or value != self._value:
+            self._value = value
+            font = text_cache.font(self.size, self.name)
+            self.surface = font.render(self.template.format(value), True, self.color)
+        return self.surface
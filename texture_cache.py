@@ -0,0 +1,130 @@
+import pygame
+from collections import OrderedDict
+from asset_bundle import asset_bundle
+
+
+class RotationSheet:
+    """Pre-rendered rotations of one texture at evenly spaced angles."""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.steps = len(frames)
+        self.sizes = tuple(frame.get_size() for frame in frames)
+        self._masks = [None] * self.steps
+
+    def index(self, angle):
+        return round(angle % 360 * self.steps / 360) % self.steps
+
+    def frame(self, angle):
+        return self.frames[self.index(angle)]
+
+    def mask(self, angle):
+        index = self.index(angle)
+        if self._masks[index] is None:
+            self._masks[index] = pygame.mask.from_surface(self.frames[index])
+        return self._masks[index]
+
+
+class TextureCache:
+    """Process-wide cache of scaled, rotated and converted surfaces.
+
+    Surfaces handed out by the cache are shared between sprites and must
+    be treated as read-only.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self._sheets = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, path, size, rotation=0):
+        key = (path, tuple(size), rotation % 360)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self._load(*key)
+        self._store(key, surface)
+        return surface
+
+    def put(self, path, size, surface):
+        """Adopt a surface loaded and scaled elsewhere, e.g. on a loader thread.
+
+        The conversion to the display format happens here, so this must be
+        called from the main thread. An existing entry is kept.
+        """
+        key = (path, tuple(size), 0)
+        if key not in self._surfaces:
+            self._store(key, self._convert(surface))
+
+    def _store(self, key, surface):
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+
+    def rotation_sheet(self, path, size, steps=72):
+        """Rotations of the pristine scaled texture every ``360 / steps`` degrees.
+
+        Sheets are kept outside the LRU so a sheet never evicts, or is
+        evicted by, ordinary textures.
+        """
+        key = (path, tuple(size), steps)
+        sheet = self._sheets.get(key)
+        if sheet is None:
+            self.misses += 1
+            source = self.get(path, size)
+            frames = [source]
+            frames += [self._convert(pygame.transform.rotate(source, i * 360 / steps)) for i in range(1, steps)]
+            sheet = RotationSheet(tuple(frames))
+            self._sheets[key] = sheet
+        else:
+            self.hits += 1
+        return sheet
+
+    def put_sheet(self, path, size, steps, rotations):
+        """Adopt the ``steps - 1`` rotated frames of a sheet rendered elsewhere."""
+        key = (path, tuple(size), steps)
+        if key not in self._sheets:
+            frames = [self.get(path, size)] + [self._convert(frame) for frame in rotations]
+            self._sheets[key] = RotationSheet(tuple(frames))
+
+    def _load(self, path, size, rotation):
+        if rotation:
+            surface = pygame.transform.rotate(self.get(path, size), rotation)
+        else:
+            surface = asset_bundle.image(path, size)
+            if surface is None:
+                surface = pygame.transform.scale(pygame.image.load(path), size)
+        return self._convert(surface)
+
+    @staticmethod
+    def _convert(surface):
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
+
+    def preload(self, entries):
+        for path, size in entries:
+            self.get(path, size)
+
+    def stats(self):
+        return {
+            "entries": len(self._surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self):
+        self._surfaces.clear()
+        self._sheets.clear()
+
+
+texture_cache = TextureCache()
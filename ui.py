@@ -1,4 +1,5 @@
 import pygame
+from text_cache import text_cache
 
 class Button:
     def __init__(self, x, y, width, height, text='', color=(0, 128, 255), hover_color=(75, 200, 255), text_color=(255, 255, 255), font_size=30):
@@ -7,18 +8,27 @@ class Button:
         self.hover_color = hover_color
         self.text_color = text_color
         self.text = text
-        self.font = pygame.font.Font(None, font_size)
+        self.font_size = font_size
         self.clicked = False
+        self.hovered = False
+
+    def update_hover(self, pos):
+        """Track whether ``pos`` is over the button; True if that changed."""
+        hovered = self.rect.collidepoint(pos)
+        changed = hovered != self.hovered
+        self.hovered = hovered
+        return changed
 
     def draw(self, screen):
-        if self.rect.collidepoint(pygame.mouse.get_pos()):
+        self.update_hover(pygame.mouse.get_pos())
+        if self.hovered:
             pygame.draw.rect(screen, self.hover_color, self.rect)
         else:
             pygame.draw.rect(screen, self.color, self.rect)
 
 
         if self.text:
-            text_surface = self.font.render(self.text, True, self.text_color)
+            text_surface = text_cache.render(self.text, self.font_size, self.text_color)
             text_rect = text_surface.get_rect(center=self.rect.center)
             screen.blit(text_surface, text_rect)
 
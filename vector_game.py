@@ -0,0 +1,246 @@
+import headless  # selects the dummy SDL drivers before the window is opened
+
+import argparse
+import multiprocessing
+import os
+import time
+import traceback
+import numpy as np
+from multiprocessing import shared_memory
+from factory import EnemyFactory
+from input_handler import decode_keys
+from settings import level_path
+from headless import HeadlessGame
+
+RUNNING = 0
+LOST = 1
+WON = 2
+
+
+def observation_layout(n_games, max_enemies, max_bullets):
+    """Name, shape and dtype of every shared array.
+
+    ``enemies`` rows are (x, y, hp, kind) where kind is 1 + the type's
+    position in ``EnemyFactory.types``; ``bullets`` rows are (x, y, owner).
+    Rows past ``enemy_count``/``bullet_count`` are zero.
+    """
+    return (
+        ("actions", (n_games,), np.uint8),
+        ("status", (n_games,), np.int8),
+        ("ticks", (n_games,), np.int32),
+        ("wave", (n_games,), np.int16),
+        ("player", (n_games, 3), np.float32),
+        ("enemy_count", (n_games,), np.int32),
+        ("enemies", (n_games, max_enemies, 4), np.float32),
+        ("bullet_count", (n_games,), np.int32),
+        ("bullets", (n_games, max_bullets, 3), np.float32),
+    )
+
+
+class SharedArrays:
+    """NumPy arrays laid out back to back in one shared memory block."""
+
+    def __init__(self, layout, name=None):
+        offsets = []
+        size = 0
+        for _, shape, dtype in layout:
+            size = -(-size // 16) * 16
+            offsets.append(size)
+            size += int(np.prod(shape)) * np.dtype(dtype).itemsize
+        self.owner = name is None
+        self.memory = shared_memory.SharedMemory(name=name, create=self.owner, size=max(size, 1))
+        self.name = self.memory.name
+        self.arrays = {
+            field: np.ndarray(shape, dtype=dtype, buffer=self.memory.buf, offset=offset)
+            for (field, shape, dtype), offset in zip(layout, offsets)
+        }
+        if self.owner:
+            for array in self.arrays.values():
+                array[...] = 0
+
+    def __getitem__(self, field):
+        return self.arrays[field]
+
+    def close(self):
+        self.arrays = {}
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+
+
+def write_observation(game, index, arrays, kinds):
+    manager = game.game
+    arrays["status"][index] = LOST if manager.game_over else WON if manager.game_won else RUNNING
+    arrays["ticks"][index] = game.ticks
+    arrays["wave"][index] = manager.wave
+    player = manager.player
+    arrays["player"][index] = (player.rect.centerx, player.rect.centery, player.hp)
+
+    enemies = arrays["enemies"][index]
+    enemies[:] = 0
+    rows = [(enemy.rect.centerx, enemy.rect.centery, enemy.hp, kinds.get(type(enemy), 0))
+            for enemy in manager.enemies][:len(enemies)]
+    if rows:
+        enemies[:len(rows)] = rows
+    arrays["enemy_count"][index] = len(rows)
+
+    bullets = arrays["bullets"][index]
+    system = manager.bullets
+    live = np.flatnonzero(system.alive)[:len(bullets)]
+    bullets[:] = 0
+    bullets[:len(live), :2] = system.pos[live]
+    bullets[:len(live), 2] = system.owner[live]
+    arrays["bullet_count"][index] = len(live)
+
+
+def _worker(connection, name, layout, indices, level, seed, n_games):
+    arrays = SharedArrays(layout, name=name)
+    kinds = {enemy_class: kind + 1 for kind, enemy_class in enumerate(EnemyFactory.types.values())}
+    episodes = {index: 0 for index in indices}
+    games = {}
+
+    def reset(index):
+        games[index].reset(seed + index + n_games * episodes[index])
+        episodes[index] += 1
+        write_observation(games[index], index, arrays, kinds)
+
+    try:
+        for index in indices:
+            games[index] = HeadlessGame(level=level)
+            reset(index)
+        connection.send(("ok",))
+        while True:
+            command, *args = connection.recv()
+            if command == "reset":
+                for index in args[0]:
+                    if index in games:
+                        reset(index)
+            elif command == "step":
+                ticks, auto_reset = args
+                for index, game in games.items():
+                    if not game.game.game_running:
+                        if auto_reset:
+                            reset(index)
+                        continue
+                    game.step(ticks, decode_keys(int(arrays["actions"][index])).pressed)
+                    write_observation(game, index, arrays, kinds)
+            elif command == "close":
+                break
+            connection.send(("ok",))
+    except (EOFError, BrokenPipeError):
+        pass
+    except Exception:
+        connection.send(("error", traceback.format_exc()))
+    finally:
+        arrays.close()
+        connection.close()
+
+
+class VectorGame:
+    """Many independent headless games stepped in lockstep across worker processes.
+
+    Actions are one key bitmask per game (see ``input_handler.encode_keys``)
+    written into ``actions``; observations are read back from the shared
+    arrays in ``observations`` without any copying or pickling. The arrays
+    are overwritten by the next ``step``.
+    """
+
+    def __init__(self, n_games, workers=None, seed=0, level=level_path,
+                 max_enemies=64, max_bullets=256, ticks_per_step=1, auto_reset=True):
+        self.n_games = n_games
+        self.ticks_per_step = ticks_per_step
+        self.auto_reset = auto_reset
+        layout = observation_layout(n_games, max_enemies, max_bullets)
+        self.shared = SharedArrays(layout)
+        self.actions = self.shared["actions"]
+
+        workers = max(1, min(workers or os.cpu_count() or 1, n_games))
+        self._connections = []
+        self._processes = []
+        for indices in np.array_split(np.arange(n_games), workers):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_worker, name="vector-game",
+                args=(child, self.shared.name, layout, indices.tolist(), level, seed, n_games),
+                daemon=True,
+            )
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+        self._wait()
+
+    @property
+    def observations(self):
+        return {field: array for field, array in self.shared.arrays.items() if field != "actions"}
+
+    def _send(self, *message):
+        for connection in self._connections:
+            connection.send(message)
+        self._wait()
+
+    def _wait(self):
+        for connection in self._connections:
+            reply = connection.recv()
+            if reply[0] == "error":
+                self.close()
+                raise RuntimeError(reply[1])
+
+    def reset(self, indices=None):
+        indices = range(self.n_games) if indices is None else indices
+        self._send("reset", [int(index) for index in indices])
+        return self.observations
+
+    def step(self, actions=None):
+        if actions is not None:
+            self.actions[:] = actions
+        self._send("step", self.ticks_per_step, self.auto_reset)
+        return self.observations
+
+    def close(self):
+        if not self._processes:
+            return
+        for connection in self._connections:
+            try:
+                connection.send(("close",))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join()
+        for connection in self._connections:
+            connection.close()
+        self._processes = []
+        self._connections = []
+        self.actions = None
+        self.shared.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Step many headless games with random actions across all cores.")
+    parser.add_argument("--games", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--steps", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--level", default=level_path)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    with VectorGame(args.games, workers=args.workers, seed=args.seed, level=args.level) as games:
+        start = time.perf_counter()
+        finished = 0
+        for _ in range(args.steps):
+            observations = games.step(rng.integers(0, 32, args.games, dtype=np.uint8))
+            finished += int(np.count_nonzero(observations["status"]))
+        elapsed = time.perf_counter() - start
+    ticks = args.games * args.steps
+    print(f"{ticks} game ticks in {elapsed:.2f} s ({ticks / elapsed:.0f} ticks/s), {finished} finished episodes seen")
+
+
+if __name__ == "__main__":
+    main()